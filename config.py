@@ -17,13 +17,23 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
-BASE_DIRECTORY = Path(__file__).resolve().parent
+
+@lru_cache(maxsize=1)
+def _base_directory() -> Path:
+    """
+    Resolves project base directory once, on first use instead of at import.
+
+    Returns:
+        Path: Directory containing this module.
+    """
+    return Path(__file__).resolve().parent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Configuration settings for the extractor service management tool.
@@ -40,9 +50,11 @@ class Config:
         output_directory (str): Directory where extraction process output will be saved.
     """
     service_name: str = "extractor_service"
-    dockerfile: str = str(BASE_DIRECTORY / "extractor_service")
+    dockerfile: str = field(default_factory=lambda: str(_base_directory() / "extractor_service"))
     port: int = 8100
     volume_input_directory: str = "/app/input_directory"
     volume_output_directory: str = "/app/output_directory"
-    input_directory: str = str(BASE_DIRECTORY / "input_directory")
-    output_directory: str = str(BASE_DIRECTORY / "output_directory")
+    input_directory: str = field(
+        default_factory=lambda: str(_base_directory() / "input_directory"))
+    output_directory: str = field(
+        default_factory=lambda: str(_base_directory() / "output_directory"))
@@ -19,8 +19,10 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import BackgroundTasks, HTTPException
+from fastapi import HTTPException
 
 from .dependencies import ExtractorDependencies
 from .extractors import Extractor, ExtractorFactory
@@ -35,6 +37,8 @@ class ExtractorManager:
     maintaining system stability.
     """
     _active_extractor = None
+    _lock = threading.Lock()
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extractor")
 
     @classmethod
     def get_active_extractor(cls) -> str:
@@ -47,23 +51,25 @@ class ExtractorManager:
         return cls._active_extractor
 
     @classmethod
-    def start_extractor(cls, extractor_name: str, background_tasks: BackgroundTasks,
-                        config: ExtractorConfig, dependencies: ExtractorDependencies) -> str:
+    def start_extractor(cls, extractor_name: str, config: ExtractorConfig,
+                        dependencies: ExtractorDependencies) -> str:
         """
-        Initializes the extractor class and runs the extraction process in the background.
+        Initializes the extractor class and runs the extraction process in the background
+            on dedicated extractor thread, so FastAPI threadpool isn't occupied by it.
 
         Args:
             extractor_name (str): The name of the extractor that will be used.
-            background_tasks (BackgroundTasks): A FastAPI tool for running tasks in background.
             config (ExtractorConfig): A Pydantic model with extractor configuration.
             dependencies(ExtractorDependencies): Dependencies that will be used in extractor.
 
         Returns:
             str: Endpoint feedback message with started extractor name.
         """
-        cls._check_is_already_extracting()
-        extractor = ExtractorFactory.create_extractor(extractor_name, config, dependencies)
-        background_tasks.add_task(cls.__run_extractor, extractor, extractor_name)
+        with cls._lock:  # endpoints run in threadpool, check and claim must be atomic
+            cls._check_is_already_extracting()
+            extractor = ExtractorFactory.create_extractor(extractor_name, config, dependencies)
+            cls._active_extractor = extractor_name
+        cls._executor.submit(cls.__run_extractor, extractor, extractor_name)
         message = f"'{extractor_name}' started."
         return message
 
@@ -77,8 +83,10 @@ class ExtractorManager:
             extractor_name (str): The name of the extractor that will be used.
         """
         try:
-            cls._active_extractor = extractor_name
+            logger.debug("Running extractor: %s", extractor_name)
             extractor.process()
+        except Exception:
+            logger.exception("Extractor '%s' failed.", extractor_name)
         finally:
             cls._active_extractor = None
 
@@ -22,12 +22,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
-import gc
 import logging
+import os
+import queue
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Type
+from typing import Generator, Type, TypeVar
 
 import numpy as np
 
@@ -39,6 +42,8 @@ from .video_processors import VideoProcessor
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Extractor(ABC):
     """Abstract class for creating extractors."""
@@ -46,6 +51,10 @@ class Extractor(ABC):
     class EmptyInputDirectoryError(Exception):
         """Error appear when extractor can't get any input to extraction."""
 
+    # images encoding and decoding is CPU-bound and OpenCV releases GIL, one thread per core
+    _io_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4,
+                                      thread_name_prefix="images_io")
+
     def __init__(self, config: ExtractorConfig,
                  image_processor: Type[ImageProcessor],
                  video_processor: Type[VideoProcessor],
@@ -65,6 +74,8 @@ class Extractor(ABC):
         self._video_processor = video_processor
         self._image_evaluator_class = image_evaluator_class
         self._image_evaluator = None
+        self._pending_saves = deque()
+        self._normalization_buffers = deque()
 
     @abstractmethod
     def process(self) -> None:
@@ -88,20 +99,15 @@ class Extractor(ABC):
             config input directory.
 
         Args:
-            extensions (tuple): Searched files extensions.
+            extensions (tuple): Searched files extensions, matched case-insensitively.
             prefix (str | None): Excluded files filename prefix. Default is None.
 
         Returns:
             list[Path]: All matching files list.
         """
         directory = self._config.input_directory
-        entries = directory.iterdir()
-        files = [
-            entry for entry in entries
-            if entry.is_file()
-               and entry.suffix in extensions
-               and (prefix is None or not entry.name.startswith(prefix))
-        ]
+        lowercase_extensions = tuple(extension.lower() for extension in extensions)
+        files = list(_list_directory_files(directory, lowercase_extensions, prefix))
         if not files:
             prefix = prefix if prefix else "Prefix not provided"
             error_massage = (
@@ -126,12 +132,12 @@ class Extractor(ABC):
         Returns:
             np.array: Array with images scores in given images order.
         """
-        scores = np.array(self._image_evaluator.evaluate_images(normalized_images))
+        scores = np.asarray(self._image_evaluator.evaluate_images(normalized_images))
         return scores
 
     def _read_images(self, paths: list[Path]) -> list[np.ndarray]:
         """
-        Read all images from given paths synonymously.
+        Read all images from given paths synonymously using shared I/O thread pool.
 
         Args:
             paths (list[Path]): List of images paths.
@@ -139,32 +145,35 @@ class Extractor(ABC):
         Returns:
             list[np.ndarray]: List of images in numpy ndarrays.
         """
-        with ThreadPoolExecutor() as executor:
-            images = []
-            futures = [executor.submit(
-                self._image_processor.read_image, path,
-            ) for path in paths]
-            for future in futures:
-                image = future.result()
-                if image is not None:
-                    images.append(image)
-            return images
+        images = [
+            image for image in self._io_executor.map(self._image_processor.read_image, paths)
+            if image is not None
+        ]
+        return images
 
     def _save_images(self, images: list[np.ndarray]) -> None:
         """
-        Save all images in config output directory synonymously.
+        Schedule saving all images in config output directory in shared I/O thread pool,
+            so encoding and writing images overlaps next batch processing.
+            Number of images waiting for saving is limited by config batch size.
 
         Args:
             images (list[np.ndarray]): List of images in numpy ndarrays.
         """
-        with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(
-                self._image_processor.save_image, image,
-                self._config.output_directory,
-                self._config.images_output_format
-            ) for image in images]
-            for future in futures:
-                future.result()
+        max_pending_saves = self._config.batch_size
+        output_directory = self._config.output_directory
+        output_format = self._config.images_output_format
+        for image in images:
+            if len(self._pending_saves) >= max_pending_saves:
+                self._pending_saves.popleft().result()
+            self._pending_saves.append(self._io_executor.submit(
+                self._image_processor.save_image, image, output_directory, output_format
+            ))
+
+    def _wait_for_saved_images(self) -> None:
+        """Wait until all scheduled images are saved, raising first saving error if any."""
+        while self._pending_saves:
+            self._pending_saves.popleft().result()
 
     def _normalize_images(self, images: list[np.ndarray],
                           target_size: tuple[int, int]) -> np.ndarray:
@@ -178,9 +187,45 @@ class Extractor(ABC):
         Returns:
             np.ndarray: All images as a one numpy array.
         """
-        normalized_images = self._image_processor.normalize_images(images, target_size)
+        buffer = self._get_normalization_buffer(len(images), target_size)
+        normalized_images = self._image_processor.normalize_images(images, target_size, buffer)
         return normalized_images
 
+    def _get_normalization_buffer(self, images_number: int,
+                                  target_size: tuple[int, int]) -> np.ndarray:
+        """
+        Takes buffer for normalized images from the pool, allocates new one if pool is empty.
+            Buffers are batch sized so smaller batches get a view of the buffer.
+
+        Args:
+            images_number (int): Number of images that will be normalized.
+            target_size (tuple[int, int]): Images will be normalized to this size.
+
+        Returns:
+            np.ndarray: Float32 array for normalized images.
+        """
+        width, height = target_size
+        shape = (max(images_number, self._config.batch_size), height, width, 3)
+        try:
+            buffer = self._normalization_buffers.pop()
+        except IndexError:
+            buffer = None
+        if buffer is None or buffer.shape[1:] != shape[1:] or len(buffer) < images_number:
+            buffer = np.empty(shape, dtype=np.float32)
+        return buffer[:images_number]
+
+    def _release_normalized_images(self, normalized_images: np.ndarray) -> None:
+        """
+        Gives buffer of already evaluated normalized images back to the pool.
+
+        Args:
+            normalized_images (np.ndarray): Images returned by _normalize_images,
+                they can't be used after release.
+        """
+        buffer = normalized_images.base
+        if buffer is not None:
+            self._normalization_buffers.append(buffer)
+
     @staticmethod
     def _add_prefix(prefix: str, path: Path) -> Path:
         """
@@ -199,6 +244,63 @@ class Extractor(ABC):
                      prefix, path, new_path)
         return new_path
 
+    @staticmethod
+    def _prefetch(generator: Generator[T, None, None],
+                  buffer_size: int = 1) -> Generator[T, None, None]:
+        """
+        Runs given generator in a background thread, so next items are produced
+            while current one is processed. Bounded buffer keeps memory usage limited:
+            besides the item held by consumer, up to buffer_size items wait in buffer
+            and one more is being produced, so buffer_size + 1 extra items at most.
+
+        Args:
+            generator (Generator): Generator which items will be produced in background.
+            buffer_size (int): Maximum number of produced items waiting for consumer.
+
+        Yields:
+            T: Items produced by given generator in the same order.
+        """
+        buffer = queue.Queue(maxsize=buffer_size)
+        stop_event = threading.Event()
+        end_of_items = object()
+
+        def produce() -> None:
+            try:
+                for item in generator:
+                    buffer.put((item, None))
+                    # don't keep consumed item alive while next one is produced
+                    del item
+                    if stop_event.is_set():
+                        break
+            except Exception as error:
+                buffer.put((None, error))
+            finally:
+                generator.close()
+                buffer.put((end_of_items, None))
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                item, error = buffer.get()
+                if error is not None:
+                    raise error
+                if item is end_of_items:
+                    return
+                # yielded from temporary list, so this frame doesn't keep item alive
+                # while consumer processes it and waits for the next one
+                pending_item = [item]
+                del item
+                yield pending_item.pop()
+        finally:
+            stop_event.set()
+            while producer.is_alive():
+                try:
+                    buffer.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            producer.join()
+
     @staticmethod
     def _signal_readiness_for_shutdown() -> None:
         """
@@ -208,6 +310,31 @@ class Extractor(ABC):
         logger.info("Service ready for shutdown")
 
 
+def _list_directory_files(directory: Path, extensions: tuple[str, ...],
+                          prefix: str | None) -> tuple[Path, ...]:
+    """
+    List all files with given extensions except files with given filename prefix
+        from given directory.
+
+    Args:
+        directory (Path): Directory to list.
+        extensions (tuple): Searched lowercase files extensions.
+        prefix (str | None): Excluded files filename prefix.
+
+    Returns:
+        tuple[Path, ...]: All matching files.
+    """
+    logger.debug("Listing directory '%s'.", directory)
+    with os.scandir(directory) as entries:
+        # names are checked first, is_file uses file type cached by scandir
+        return tuple(
+            Path(entry.path) for entry in entries
+            if entry.name.lower().endswith(extensions)
+            and (prefix is None or not entry.name.startswith(prefix))
+            and entry.is_file()
+        )
+
+
 class ExtractorFactory:
     """Extractor factory for getting extractors class by their names."""
 
@@ -225,17 +352,14 @@ class ExtractorFactory:
         Returns:
             Extractor: Chosen extractor class.
         """
-        match extractor_name:
-            case "best_frames_extractor":
-                return BestFramesExtractor(config, dependencies.image_processor,
-                                           dependencies.video_processor, dependencies.evaluator)
-            case "top_images_extractor":
-                return TopImagesExtractor(config, dependencies.image_processor,
-                                          dependencies.video_processor, dependencies.evaluator)
-            case _:
-                error_massage = f"Provided unknown extractor name: {extractor_name}"
-                logger.error(error_massage)
-                raise ValueError(error_massage)
+        try:
+            extractor_class = _EXTRACTORS[extractor_name]
+        except KeyError:
+            error_massage = f"Provided unknown extractor name: {extractor_name}"
+            logger.error(error_massage)
+            raise ValueError(error_massage) from None
+        return extractor_class(config, dependencies.image_processor,
+                               dependencies.video_processor, dependencies.evaluator)
 
 
 class BestFramesExtractor(Extractor):
@@ -248,13 +372,15 @@ class BestFramesExtractor(Extractor):
         """
         logger.info("Starting frames extraction process from '%s'.",
                     self._config.input_directory)
+        processed_video_prefix = self._config.processed_video_prefix
         videos_paths = self._list_input_directory_files(self._config.video_extensions,
-                                                        self._config.processed_video_prefix)
+                                                        processed_video_prefix)
         if self._config.all_frames is False:  # evaluator won't be used if all frames
             self._get_image_evaluator()
         for video_path in videos_paths:
             self._extract_best_frames(video_path)
-            self._add_prefix(self._config.processed_video_prefix, video_path)
+            self._wait_for_saved_images()
+            self._add_prefix(processed_video_prefix, video_path)
             logger.info("Frames extraction has finished for video: %s", video_path)
         logger.info("Extraction process finished. All frames extracted.")
         self._signal_readiness_for_shutdown()
@@ -262,10 +388,38 @@ class BestFramesExtractor(Extractor):
     def _extract_best_frames(self, video_path: Path) -> None:
         """
         Extract best visually frames from given video.
+            Next frames batch is read and normalized in background while current one
+            is evaluated, saving is also done in background. Besides the evaluated batch,
+            up to two more frames batches are kept in memory (one waiting, one being read)
+            plus frames waiting to be saved.
 
         Args:
             video_path (Path): Path of the video that will be extracted.
         """
+        frames_batch_generator = self._prefetch(self._get_frames_batches(video_path))
+        extracted_frames_number = 0
+        for frames, normalized_images in frames_batch_generator:
+            if normalized_images is not None:
+                frames = self._get_best_frames(frames, normalized_images)
+                self._release_normalized_images(normalized_images)
+            self._save_images(frames)
+            extracted_frames_number += len(frames)
+        logger.info("Frames extracted from video(%s).", extracted_frames_number)
+
+    def _get_frames_batches(self, video_path: Path) -> Generator[
+            tuple[list[np.ndarray], np.ndarray | None], None, None]:
+        """
+        Reads frames batches from given video and normalizes them for evaluation.
+
+        Args:
+            video_path (Path): Path of the video that will be read.
+
+        Yields:
+            tuple: Frames batch and its normalized images,
+                normalized images are None if all frames are extracted without evaluation.
+        """
+        all_frames = self._config.all_frames
+        target_image_size = self._config.target_image_size
         frames_batch_generator = self._video_processor.get_next_frames(
             video_path, self._config.batch_size
         )
@@ -273,34 +427,36 @@ class BestFramesExtractor(Extractor):
             if not frames:
                 continue
             logger.debug("Frames batch generated.")
-            if not self._config.all_frames:
-                frames = self._get_best_frames(frames)
-            self._save_images(frames)
-            del frames
-            gc.collect()
-
-    def _get_best_frames(self, frames: list[np.ndarray]) -> list[np.ndarray]:
+            normalized_images = None
+            if not all_frames:
+                normalized_images = self._normalize_images(frames, target_image_size)
+            yield frames, normalized_images
+            # not best frames can be freed while next batch is decoded
+            del frames, normalized_images
+
+    def _get_best_frames(self, frames: list[np.ndarray],
+                         normalized_images: np.ndarray) -> list[np.ndarray]:
         """
         Splits images batch for comparing groups and select best image for each group.
 
         Args:
             frames (list[np.ndarray]): Batch of images in numpy ndarray.
+            normalized_images (np.ndarray): Given frames already normalized for evaluation.
 
         Returns:
             list[np.ndarray]: Best images list.
         """
-        normalized_images = self._normalize_images(frames, self._config.target_image_size)
         scores = self._evaluate_images(normalized_images)
-        del normalized_images
 
-        best_frames = []
         group_size = self._config.compering_group_size
-        groups = np.array_split(scores, np.arange(group_size, len(scores), group_size))
-        for index, group in enumerate(groups):
-            best_index = np.argmax(group)
-            global_index = index * group_size + best_index
-            best_frames.append(frames[global_index])
-        logger.info("Best frames selected(%s).", len(best_frames))
+        full_groups_end = len(scores) - len(scores) % group_size
+        best_indices = np.argmax(scores[:full_groups_end].reshape(-1, group_size), axis=1)
+        best_indices += np.arange(0, full_groups_end, group_size)
+        if full_groups_end < len(scores):  # last group is smaller
+            last_group_best_index = full_groups_end + np.argmax(scores[full_groups_end:])
+            best_indices = np.append(best_indices, last_group_best_index)
+        best_frames = [frames[index] for index in best_indices.tolist()]
+        logger.debug("Best frames selected(%s).", len(best_frames))
         return best_frames
 
 
@@ -311,36 +467,100 @@ class TopImagesExtractor(Extractor):
         """
         Rate all images in given config input directory and
         extract images that are in top percent of images visually.
+            All images are rated first, so top percent is computed from all images scores,
+            then only top images are read again and saved.
         """
         images_paths = self._list_input_directory_files(self._config.images_extensions)
         self._get_image_evaluator()
-        for batch_index in range(0, len(images_paths), self._config.batch_size):
-            batch = images_paths[batch_index:batch_index + self._config.batch_size]
-            images = self._read_images(batch)
-            normalized_images = self._normalize_images(images, self._config.target_image_size)
-            scores = self._evaluate_images(normalized_images)
-            top_images = self._get_top_percent_images(images, scores,
-                                                      self._config.top_images_percent)
-            self._save_images(top_images)
+        rated_paths, scores = self._rate_images(images_paths)
+        top_images_paths = []
+        if rated_paths:
+            top_images_paths = self._get_top_percent_images(
+                rated_paths, scores, self._config.top_images_percent
+            )
+        batch_size = self._config.batch_size
+        for batch_index in range(0, len(top_images_paths), batch_size):
+            batch = top_images_paths[batch_index:batch_index + batch_size]
+            self._save_images(self._read_images(batch))
+        self._wait_for_saved_images()
+        logger.info("Top images selected(%s).", len(top_images_paths))
         logger.info("Extraction process finished. All top images extracted from directory: %s.",
                     self._config.input_directory)
         self._signal_readiness_for_shutdown()
 
+    def _rate_images(self, paths: list[Path]) -> tuple[list[Path], np.ndarray]:
+        """
+        Evaluate all images from given paths batch by batch without keeping them in memory.
+            Next batch is read and normalized in background while current one is evaluated.
+
+        Args:
+            paths (list[Path]): List of images paths.
+
+        Returns:
+            tuple: Paths of images that could be read and array with their scores.
+        """
+        rated_paths = []
+        scores = []
+        for batch, normalized_images in self._prefetch(self._get_images_batches(paths)):
+            scores.append(self._evaluate_images(normalized_images))
+            self._release_normalized_images(normalized_images)
+            rated_paths.extend(batch)
+        scores = np.concatenate(scores) if scores else np.empty(0)
+        return rated_paths, scores
+
+    def _get_images_batches(self, paths: list[Path]) -> Generator[
+            tuple[list[Path], np.ndarray], None, None]:
+        """
+        Reads images batches from given paths and normalizes them for evaluation.
+
+        Args:
+            paths (list[Path]): List of images paths.
+
+        Yields:
+            tuple: Paths of images that could be read and their normalized images.
+        """
+        batch_size = self._config.batch_size
+        target_image_size = self._config.target_image_size
+        read_image = self._image_processor.read_image
+        for batch_index in range(0, len(paths), batch_size):
+            batch = paths[batch_index:batch_index + batch_size]
+            read_paths, images = [], []
+            for path, image in zip(batch, self._io_executor.map(read_image, batch)):
+                if image is not None:
+                    read_paths.append(path)
+                    images.append(image)
+            if not images:
+                continue
+            yield read_paths, self._normalize_images(images, target_image_size)
+
     @staticmethod
-    def _get_top_percent_images(images: list[np.ndarray], scores: np.array,
-                                top_percent: float) -> list[np.ndarray]:
+    def _get_top_percent_images(images: list[T], scores: np.array,
+                                top_percent: float) -> list[T]:
         """
         Returns images that have scores in the top percent of all scores.
 
         Args:
-            images (list[np.ndarray]): Batch of images in numpy ndarray.
-            scores (np.array): Array with images scores with images batch order.
-            top_percent (float): The top percentage of scores to include (e.g. 80 for top 80%).
+            images (list[T]): Images in numpy ndarray or their paths.
+            scores (np.array): Array with images scores with images order.
+            top_percent (float): Percent of the best scored images to keep
+                (e.g. 90 keeps images with scores in the top 90%).
 
         Returns:
-            list[np.ndarray]: Top images from given images batch.
+            list[T]: Top images from given images.
         """
-        threshold = np.percentile(scores, top_percent)
-        top_images = [img for img, score in zip(images, scores) if score >= threshold]
-        logger.info("Top images selected(%s).", len(top_images))
+        # same threshold as np.percentile(scores, 100 - top_percent) with linear interpolation,
+        # but selected in O(n) instead of sorting:
+        # scores >= percentile <=> scores >= score at ceil(virtual index)
+        percentile = 100 - top_percent
+        threshold_index = int(np.ceil((len(scores) - 1) * (percentile / 100)))
+        threshold = np.partition(scores, threshold_index)[threshold_index]
+        top_indices = np.flatnonzero(scores >= threshold)
+        top_images = [images[index] for index in top_indices.tolist()]
+        logger.debug("Top images selected(%s).", len(top_images))
         return top_images
+
+
+_EXTRACTORS: dict[str, Type[Extractor]] = {
+    "best_frames_extractor": BestFramesExtractor,
+    "top_images_extractor": TopImagesExtractor,
+}
@@ -20,15 +20,19 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import logging
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Callable
 
 import numpy as np
 import requests
 import tensorflow as tf
+from requests.adapters import HTTPAdapter
 from tensorflow import convert_to_tensor
 from tensorflow.keras import Model
 from tensorflow.keras.layers import Dense, Dropout
+from urllib3.util.retry import Retry
 
 from .schemas import ExtractorConfig
 
@@ -90,7 +94,7 @@ class InceptionResNetNIMA(ImageEvaluator):
         Args:
             config (ExtractorConfig): Configuration object for the image evaluator.
         """
-        self._model = _ResNetModel.get_model(config)
+        self._predict = _ResNetModel.get_predict_function(config)
 
     def evaluate_images(self, images: np.ndarray) -> list[float]:
         """
@@ -102,34 +106,37 @@ class InceptionResNetNIMA(ImageEvaluator):
         Returns:
             list[float]: List of scores corresponding to the input images.
         """
-        logger.info("Evaluating images...")
+        logger.debug("Evaluating images...")
         tensor = convert_to_tensor(images)
-        batch_size = images.shape[0]
-        predictions = self._model.predict(tensor, batch_size=batch_size, verbose=0)
+        predictions = self._predict(tensor).numpy()
         weights = _ResNetModel.get_prediction_weights()
-        scores = [self._calculate_weighted_mean(prediction, weights) for prediction in predictions]
+        scores = self._calculate_weighted_mean(predictions, weights).tolist()
         self._check_scores(images, scores)
-        logger.info("Images batch evaluated.")
+        logger.debug("Images batch evaluated.")
         return scores
 
     @staticmethod
-    def _calculate_weighted_mean(prediction: np.array, weights: np.array = None) -> float:
+    def _calculate_weighted_mean(predictions: np.array, weights: np.array = None) -> np.array:
         """
-        Calculate the weighted mean of the prediction to get final image score.
+        Calculate the weighted mean of the predictions to get final images scores.
         For example model InceptionResNetV2 returns 10 prediction scores for each image.
         We want to calculate weighted mean from that classification scores to calculate
         image final score. First classification score is less important and last is most.
+        All predictions of the batch are weighted with one matrix-vector product.
 
         Args:
-            prediction (np.array): Array of classification scores.
+            predictions (np.array): Array of classification scores for each image,
+                or classification scores of one image.
 
         Returns:
-            float: Weighted mean of the prediction.
+            np.array: Weighted mean of each prediction.
         """
+        predictions = np.asarray(predictions)
         if weights is None:
-            weights = np.ones_like(prediction)  # Default weights, equally distribute importance
-        weighted_mean = np.sum(prediction * weights) / np.sum(weights)
-        return weighted_mean
+            # Default weights, equally distribute importance
+            weights = np.ones(predictions.shape[-1], dtype=predictions.dtype)
+        weighted_means = predictions @ weights / np.sum(weights)
+        return weighted_means
 
 
 class _NIMAModel(ABC):
@@ -143,17 +150,26 @@ class _NIMAModel(ABC):
 
     _config = None
     _model = None
+    _predict_function = None
+    # guards only creation, already created model is read without locking
+    _lock = threading.Lock()
+    _download_chunk_size = 1024 * 1024
+    # transient connection errors and server errors are retried with backoff
+    _download_retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                              raise_on_status=False)
 
     @classmethod
     def reset(cls) -> None:
         """Resets class for using new model and config."""
         cls._model = None
+        cls._predict_function = None
         cls._config = None
 
     @classmethod
     def get_model(cls, config: ExtractorConfig) -> Model:
         """
         Get the NIMA model instance, downloading the weights if necessary.
+            Model is created only once even if many threads ask for it at the same time.
 
         Args:
             config (ExtractorConfig): Configuration object for the model.
@@ -162,11 +178,39 @@ class _NIMAModel(ABC):
             Model: NIMA model instance.
         """
         if cls._model is None:
-            cls._config = config
-            model_weights_path = cls._get_model_weights()
-            cls._model = cls._create_model(model_weights_path)
+            with cls._lock:
+                if cls._model is None:
+                    cls._config = config
+                    model_weights_path = cls._get_model_weights()
+                    cls._model = cls._create_model(model_weights_path)
         return cls._model
 
+    @classmethod
+    def get_predict_function(cls, config: ExtractorConfig) -> Callable[[tf.Tensor], tf.Tensor]:
+        """
+        Get the NIMA model inference forward pass compiled to TensorFlow graph.
+            Unlike Model.predict it doesn't set up Keras data adapters and callbacks
+            on every call, and the graph is traced once for any batch size.
+
+        Args:
+            config (ExtractorConfig): Configuration object for the model.
+
+        Returns:
+            Callable: Function returning model predictions tensor for given images tensor.
+        """
+        if cls._predict_function is None:
+            model = cls.get_model(config)
+            with cls._lock:
+                if cls._predict_function is None:
+                    def predict(images: tf.Tensor) -> tf.Tensor:
+                        return model(images, training=False)
+
+                    cls._predict_function = tf.function(
+                        predict, autograph=False,
+                        input_signature=[tf.TensorSpec(model.input_shape, tf.float32)]
+                    )
+        return cls._predict_function
+
     @classmethod
     @abstractmethod
     def _create_model(cls, model_weights_path: Path) -> Model:
@@ -204,6 +248,9 @@ class _NIMAModel(ABC):
     def _download_model_weights(cls, weights_path: Path, timeout: int = 10) -> None:
         """
         Download the model weights from the specified URL.
+            Weights are streamed to temporary file in chunks, so whole file isn't kept
+            in memory and interrupted download doesn't leave incomplete weights file.
+            Failed connections and server errors are retried with backoff.
 
         Args:
             weights_path (Path): Path to save the downloaded weights.
@@ -214,16 +261,21 @@ class _NIMAModel(ABC):
         """
         url = f"{cls._config.weights_repo_url}{cls._config.weights_filename}"
         logger.debug("Downloading model weights from ulr: %s", url)
-        response = requests.get(url, allow_redirects=True, timeout=timeout)
-        if response.status_code == 200:
-            weights_path.parent.mkdir(parents=True, exist_ok=True)
-            weights_path.write_bytes(response.content)
-            logger.debug("Model weights downloaded and saved to %s", weights_path)
-        else:
-            error_message = (f"Failed to download the weights: HTTP status code "
-                             f"{response.status_code}")
-            logger.error(error_message)
-            raise cls.DownloadingModelWeightsError(error_message)
+        with requests.Session() as session:
+            session.mount(url, HTTPAdapter(max_retries=cls._download_retries))
+            with session.get(url, allow_redirects=True, timeout=timeout, stream=True) as response:
+                if response.status_code != 200:
+                    error_message = (f"Failed to download the weights: HTTP status code "
+                                     f"{response.status_code}")
+                    logger.error(error_message)
+                    raise cls.DownloadingModelWeightsError(error_message)
+                weights_path.parent.mkdir(parents=True, exist_ok=True)
+                partial_weights_path = weights_path.with_name(f"{weights_path.name}.part")
+                with partial_weights_path.open("wb") as weights_file:
+                    for chunk in response.iter_content(chunk_size=cls._download_chunk_size):
+                        weights_file.write(chunk)
+        partial_weights_path.replace(weights_path)
+        logger.debug("Model weights downloaded and saved to %s", weights_path)
 
 
 class _ResNetModel(_NIMAModel):
@@ -231,7 +283,8 @@ class _ResNetModel(_NIMAModel):
     Implements the specific InceptionResNetV2-based NIMA model.
     This is helper class for NeuralImageAssessment class.
     """
-    _prediction_weights = np.arange(1, 11)
+    # float32 like model predictions, so weighting doesn't upcast them to float64
+    _prediction_weights = np.arange(1, 11, dtype=np.float32)
     _input_shape = (224, 224, 3)
     _dropout_rate = 0.75
     _num_classes = 10
@@ -255,13 +308,66 @@ class _ResNetModel(_NIMAModel):
         Returns:
             Model: NIMA model instance.
         """
-        base_model = tf.keras.applications.InceptionResNetV2(
-            input_shape=cls._input_shape, include_top=False,
-            pooling="avg", weights=None
-        )
-        processed_output = Dropout(cls._dropout_rate)(base_model.output)
-        final_output = Dense(cls._num_classes, activation="softmax")(processed_output)
-        model = Model(inputs=base_model.input, outputs=final_output)
+        previous_policy = tf.keras.mixed_precision.global_policy()
+        tf.keras.mixed_precision.set_global_policy(cls._get_dtype_policy())
+        try:
+            base_model = tf.keras.applications.InceptionResNetV2(
+                input_shape=cls._input_shape, include_top=False,
+                pooling="avg", weights=None
+            )
+            processed_output = Dropout(cls._dropout_rate)(base_model.output)
+            # softmax stays in float32 for numeric stability with mixed precision
+            final_output = Dense(cls._num_classes, activation="softmax",
+                                 dtype="float32")(processed_output)
+            model = Model(inputs=base_model.input, outputs=final_output)
+        finally:
+            tf.keras.mixed_precision.set_global_policy(previous_policy)
         model.load_weights(model_weights_path)
         logger.debug("Model loaded successfully.")
         return model
+
+    @classmethod
+    def _get_dtype_policy(cls) -> str:
+        """
+        Choose dtype policy for model layers. Mixed precision is used only when
+        GPU with Tensor Cores (compute capability 7.0+) is available,
+        because on CPU and older GPUs float16 is slower than float32.
+        Without GPU, bfloat16 mixed precision is used only if enabled in config
+        and CPU has native bfloat16 instructions (AMX or AVX-512 BF16). It's opt-in,
+        because bfloat16 scores are less precise and would depend on host CPU.
+
+        Returns:
+            str: Keras dtype policy name.
+        """
+        gpus = tf.config.list_physical_devices("GPU")
+        for gpu in gpus:
+            details = tf.config.experimental.get_device_details(gpu)
+            if details.get("compute_capability", (0, 0)) >= (7, 0):
+                logger.debug("Using mixed precision for model on GPU: %s", gpu.name)
+                return "mixed_float16"
+        if not gpus and cls._config.cpu_mixed_precision and cls._cpu_supports_bfloat16():
+            logger.debug("Using bfloat16 mixed precision for model on CPU.")
+            return "mixed_bfloat16"
+        return "float32"
+
+    @staticmethod
+    def _cpu_supports_bfloat16(cpu_info_path: Path = Path("/proc/cpuinfo")) -> bool:
+        """
+        Check if CPU has native bfloat16 instructions. Only Linux CPU info is checked,
+        on other systems bfloat16 isn't used.
+
+        Args:
+            cpu_info_path (Path): Path to CPU info file.
+
+        Returns:
+            bool: True if CPU supports AMX or AVX-512 bfloat16 instructions.
+        """
+        try:
+            with cpu_info_path.open() as cpu_info:
+                for line in cpu_info:
+                    if line.startswith("flags"):
+                        flags = set(line.partition(":")[2].split())
+                        return bool(flags & {"amx_bf16", "avx512_bf16"})
+        except OSError:
+            logger.debug("Can't read CPU info from: %s", cpu_info_path)
+        return False
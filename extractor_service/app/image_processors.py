@@ -62,7 +62,8 @@ class ImageProcessor(ABC):
 
     @staticmethod
     @abstractmethod
-    def normalize_images(images: list[np.ndarray], target_size: tuple[int, int]) -> np.array:
+    def normalize_images(images: list[np.ndarray], target_size: tuple[int, int],
+                         out: np.ndarray | None = None) -> np.array:
         """
         Resize a batch of images and convert them to a normalized numpy array.
 
@@ -70,6 +71,8 @@ class ImageProcessor(ABC):
             images (list[np.ndarray]): List of numpy ndarray images to be normalized.
             target_size (tuple | None): Target size to which the images will be resized.
                 Default is (224, 224).
+            out (np.ndarray | None): Preallocated float32 array for normalized images
+                with shape (len(images), height, width, 3). New one is created if None.
 
         Returns:
             np.ndarray: Normalized numpy array containing the resized images.
@@ -78,6 +81,9 @@ class ImageProcessor(ABC):
 
 class OpenCVImage(ImageProcessor):
     """Image processor implementation using OpenCV library."""
+    # maps every uint8 pixel value to its scaled float32 value
+    _SCALING_LUT = np.arange(256, dtype=np.float32) / np.float32(255.0)
+
     @staticmethod
     def read_image(image_path: Path) -> np.ndarray | None:
         """
@@ -127,23 +133,32 @@ class OpenCVImage(ImageProcessor):
         filename = f"image_{uuid.uuid4()}"
         return filename
 
-    @staticmethod
-    def normalize_images(images: list[np.ndarray], target_size: tuple[int, int]) -> np.array:
+    @classmethod
+    def normalize_images(cls, images: list[np.ndarray], target_size: tuple[int, int],
+                         out: np.ndarray | None = None) -> np.array:
         """
         Resize a batch of images and convert them to a normalized numpy array.
 
         Args:
             images (list[np.ndarray]): List of numpy ndarray images to be normalized.
             target_size (tuple | None): Target size to which the images will be resized.
+            out (np.ndarray | None): Preallocated float32 array for normalized images
+                with shape (len(images), height, width, 3). New one is created if None.
 
         Returns:
             np.ndarray: Normalized numpy array containing the resized images.
         """
-        batch_images = []
+        width, height = target_size
+        img_array = out
+        if img_array is None:
+            img_array = np.empty((len(images), height, width, 3), dtype=np.float32)
         logger.debug("Normalizing images...")
-        for img in images:
+        for index, img in enumerate(images):
             img_resized = cv2.resize(img, target_size, interpolation=cv2.INTER_LANCZOS4)
             img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-            batch_images.append(img_rgb)
-        img_array = np.array(batch_images, dtype=np.float32) / 255.0
+            if img_rgb.dtype == np.uint8:
+                # scaling is a table lookup written straight into the batch array
+                cv2.LUT(img_rgb, cls._SCALING_LUT, dst=img_array[index])
+            else:
+                np.divide(img_rgb, np.float32(255.0), out=img_array[index], dtype=np.float32)
         return img_array
@@ -24,7 +24,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import logging
 from pathlib import Path
 
-from pydantic import BaseModel, DirectoryPath
+from pydantic import BaseModel, DirectoryPath, Field
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +43,8 @@ class ExtractorConfig(BaseModel):
         processed_video_prefix (str): Prefix will be added to processed video after extraction.
         batch_size (int): Maximum number of images processed in a single batch.
         compering_group_size (int): Images group number to compare for finding the best one.
-        top_images_percent (float): Percentage threshold to determine the top images.
+        top_images_percent (float): Percent of the best scored images kept
+            by top_images_extractor, e.g. 90 keeps the top 90% of images.
         images_output_format (str): Format for saving output images, e.g., '.jpg', '.png'.
         target_image_size (tuple[int, int]): Images will be normalized to this size.
         weights_directory (Path | str): Directory path where model weights are stored.
@@ -51,6 +52,9 @@ class ExtractorConfig(BaseModel):
         weights_repo_url (str): URL to the repository where model weights can be downloaded.
         all_frames (bool): It changes best_frames_extractor -> frames_extractor.
             If Ture best_frames_extractor returns all frames without filtering/evaluation.
+        cpu_mixed_precision (bool): Evaluate images on CPU with bfloat16 mixed precision,
+            if CPU supports it natively. It's faster, but scores are less precise,
+            so selected images can differ between CPUs. Default is float32.
     """
     input_directory: DirectoryPath = Path("/app/input_directory")
     output_directory: DirectoryPath = Path("/app/output_directory")
@@ -62,10 +66,12 @@ class ExtractorConfig(BaseModel):
     top_images_percent: float = 90.0
     images_output_format: str = ".jpg"
     target_image_size: tuple[int, int] = (224, 224)
-    weights_directory: Path | str = Path.home() / ".cache" / "huggingface"
+    weights_directory: Path | str = Field(
+        default_factory=lambda: Path.home() / ".cache" / "huggingface")
     weights_filename: str = "weights.h5"
     weights_repo_url: str = "https://huggingface.co/BKDDFS/nima_weights/resolve/main/"
     all_frames: bool = False
+    cpu_mixed_precision: bool = False
 
 
 class Message(BaseModel):
@@ -60,6 +60,8 @@ class OpenCVVideo(VideoProcessor):
     class VideoCaptureClosed(Exception):
         """Exception raised when the video capture is prematurely closed."""
 
+    _MAX_CONSECUTIVE_FAILED_READS = 5
+
     @staticmethod
     @contextmanager
     def _video_capture(video_path: Path) -> cv2.VideoCapture:
@@ -101,6 +103,9 @@ class OpenCVVideo(VideoProcessor):
 
         Yields:
             list[np.ndarray]: A batch of video frames.
+
+        Raises:
+            VideoCaptureClosed: If too many consecutive frames can't be read.
         """
         with cls._video_capture(video_path) as video:
             frame_rate = cls._get_video_attribute(
@@ -108,9 +113,27 @@ class OpenCVVideo(VideoProcessor):
             total_frames = cls._get_video_attribute(
                 video, cv2.CAP_PROP_FRAME_COUNT, "total frames")
             frames_batch = []
+            seekable = True
+            failed_reads = 0
             logger.info("Getting frames batch...")
+            frames_to_skip = frame_rate - 1
             for frame_index in range(0, total_frames, frame_rate):
+                if seekable:
+                    seekable = cls._seek_frame(video, frame_index)
+                    if not seekable:
+                        cls._skip_to_frame(video, frame_index, video_path)
+                else:
+                    cls._grab_frames(video, frames_to_skip)
                 frame = cls._read_next_frame(video, frame_index)
+                if frame is None:
+                    failed_reads += 1
+                    if failed_reads == cls._MAX_CONSECUTIVE_FAILED_READS:
+                        error_message = (f"Couldn't read {failed_reads} consecutive frames "
+                                         f"from video: {video_path}. Video capture broke.")
+                        logger.error(error_message)
+                        raise cls.VideoCaptureClosed(error_message)
+                    continue
+                failed_reads = 0
                 frames_batch.append(frame)
                 logger.debug("Frame appended to frames batch.")
                 if len(frames_batch) == batch_size:
@@ -121,10 +144,70 @@ class OpenCVVideo(VideoProcessor):
                 logger.info("Returning last frames batch.")
                 yield frames_batch
 
+    @staticmethod
+    def _seek_frame(video: cv2.VideoCapture, frame_index: int) -> bool:
+        """
+        Moves video capture position to given frame, so frames between won't be decoded.
+
+        Args:
+            video (cv2.VideoCapture): Video capture object which position will be changed.
+            frame_index (int): Index of the frame that will be read next.
+
+        Returns:
+            bool: False if video stream can't be seeked and frames must be read sequentially.
+        """
+        if video.set(cv2.CAP_PROP_POS_FRAMES, frame_index) \
+                and int(video.get(cv2.CAP_PROP_POS_FRAMES)) == frame_index:
+            return True
+        logger.warning("Can't seek video to frame with index: %s. "
+                       "Falling back to sequential frames decoding.", frame_index)
+        return False
+
+    @classmethod
+    def _skip_to_frame(cls, video: cv2.VideoCapture, frame_index: int, video_path: Path) -> None:
+        """
+        Moves video capture position to given frame by grabbing frames sequentially.
+        Grabbed frames are decoded but not retrieved. If failed seek moved position
+        past given frame, video is reopened and frames are grabbed from the start.
+
+        Args:
+            video (cv2.VideoCapture): Video capture object which position will be changed.
+            frame_index (int): Index of the frame that will be read next.
+            video_path (Path): Path of the video, used to reopen the video capture.
+
+        Raises:
+            CantOpenVideoCapture: If the video file cannot be reopened.
+        """
+        position = int(video.get(cv2.CAP_PROP_POS_FRAMES))
+        if position > frame_index:
+            logger.warning("Video position %s is past frame with index: %s. "
+                           "Reopening video.", position, frame_index)
+            if not video.open(str(video_path)):
+                error_massage = f"Can't open video file: {video_path}"
+                logger.error(error_massage)
+                raise cls.CantOpenVideoCapture(error_massage)
+            position = 0
+        cls._grab_frames(video, frame_index - position)
+
+    @staticmethod
+    def _grab_frames(video: cv2.VideoCapture, frames_number: int) -> None:
+        """
+        Moves video capture position forward by grabbing given number of frames.
+        Grabbed frames are decoded but not retrieved.
+
+        Args:
+            video (cv2.VideoCapture): Video capture object which position will be changed.
+            frames_number (int): Number of frames that will be skipped.
+        """
+        for _ in range(frames_number):
+            if not video.grab():
+                break
+
     @classmethod
     def _read_next_frame(cls, video: cv2.VideoCapture, frame_index: int) -> np.ndarray | None:
         """
-        Reads frame with specified index from provided video.
+        Reads frame at current position of provided video.
+        Video capture is checked only after failed read, read fails on closed capture anyway.
 
         Args:
             video: Video capture object from which frame will be taken.
@@ -132,11 +215,13 @@ class OpenCVVideo(VideoProcessor):
 
         Returns:
             np.ndarray: Decoded frame.
+
+        Raises:
+            ValueError: If read failed because the video capture is closed.
         """
-        cls._check_video_capture(video)
-        video.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
         success, frame = video.read()
         if not success:
+            cls._check_video_capture(video)
             logger.warning("Couldn't read frame with index: %s", frame_index)
             return None
         return frame
@@ -23,21 +23,20 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import argparse
 import logging
 import os
 import sys
 
 import uvicorn
-from fastapi import BackgroundTasks, Depends, FastAPI
+from fastapi import FastAPI
 
 if os.getenv("DOCKER_ENV"):
-    from app.dependencies import (ExtractorDependencies,
-                                  get_extractor_dependencies)
+    from app.dependencies import EXTRACTOR_DEPENDENCIES
     from app.extractor_manager import ExtractorManager
     from app.schemas import ExtractorConfig, ExtractorStatus, Message
 else:
-    from .app.dependencies import (ExtractorDependencies,
-                                   get_extractor_dependencies)
+    from .app.dependencies import EXTRACTOR_DEPENDENCIES
     from .app.extractor_manager import ExtractorManager
     from .app.schemas import ExtractorConfig, ExtractorStatus, Message
 
@@ -64,26 +63,48 @@ def get_extractors_status() -> ExtractorStatus:
 @app.post("/v2/extractors/{extractor_name}")
 def run_extractor(
         extractor_name: str,
-        background_tasks: BackgroundTasks,
-        config: ExtractorConfig = ExtractorConfig(),
-        dependencies: ExtractorDependencies = Depends(get_extractor_dependencies)
+        config: ExtractorConfig = ExtractorConfig()
 ) -> Message:
     """
     Runs provided extractor.
 
     Args:
         extractor_name (str): The name of the extractor that will be used.
-        background_tasks (BackgroundTasks): A FastAPI tool for running tasks in background.
-        dependencies(ExtractorDependencies): Dependencies that will be used in extractor.
         config (ExtractorConfig): A Pydantic model with extractor configuration.
 
     Returns:
         Message: Contains the operation status.
     """
-    message = ExtractorManager.start_extractor(extractor_name, background_tasks,
-                                               config, dependencies)
+    message = ExtractorManager.start_extractor(extractor_name, config, EXTRACTOR_DEPENDENCIES)
     return Message(message=message)
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parses command line arguments for running the service with uvicorn.
+
+    Returns:
+        argparse.Namespace: Arguments from user.
+    """
+    parser = argparse.ArgumentParser(description="Runs extractor service.")
+    parser.add_argument("--host", default="localhost",
+                        help="Host the service will be bound to.")
+    parser.add_argument("--port", type=int, default=8100,
+                        help="Port the service will be bound to.")
+    parser.add_argument("--loop", choices=["auto", "asyncio", "uvloop"], default="auto",
+                        help="Event loop implementation. 'auto' uses uvloop if installed.")
+    parser.add_argument("--http", choices=["auto", "h11", "httptools"], default="auto",
+                        help="HTTP protocol implementation. "
+                             "'auto' uses httptools if installed.")
+    parser.add_argument("--reload", action="store_true",
+                        help="Reload service on code changes. For development only, "
+                             "it reimports modules together with the model.")
+    args = parser.parse_args()
+    return args
+
+
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="localhost", port=8100, reload=True)
+    arguments = parse_args()
+    uvicorn.run("main:app", host=arguments.host, port=arguments.port,
+                loop=arguments.loop, http=arguments.http,
+                reload=arguments.reload, workers=1)
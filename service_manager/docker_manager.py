@@ -22,13 +22,39 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import json
 import logging
+import os
+import socket
 import subprocess
 import sys
-from typing import Optional
+import time
+from functools import cached_property, lru_cache, partial
+from http.client import HTTPConnection, HTTPException, HTTPResponse
+from pathlib import Path
+from typing import Callable, Generator, Optional
+from urllib.parse import quote, urlsplit
 
 logger = logging.getLogger(__name__)
 
+_NOT_CHECKED = object()
+
+
+@lru_cache(maxsize=128)
+def _resolve_directory(directory: str) -> str:
+    """
+    Resolves symlinks in directory path once per given path, as docker volumes
+    require canonical absolute paths.
+
+    Args:
+        directory (str): Absolute directory path. It must be absolute, so the cached
+            result doesn't depend on the current working directory.
+
+    Returns:
+        str: Canonical absolute path of the directory.
+    """
+    return str(Path(directory).resolve())
+
 
 class DockerManager:
     """
@@ -38,6 +64,10 @@ class DockerManager:
     class ServiceShutdownSignal(Exception):
         """Exception raised when the service signals it is ready to be shut down."""
 
+    _SHUTDOWN_MESSAGE = b"Service ready for shutdown"
+    _LOGS_CHUNK_SIZE = 1 << 16
+    _stop_timeout = 10  # seconds before container is killed, same as docker stop default
+
     def __init__(self, container_name: str, input_dir: str,
                  output_dir: str, port: int, force_build: bool, cpu_only: bool) -> None:
         """
@@ -50,14 +80,27 @@ class DockerManager:
             port (int): Port number to expose from the container.
         """
         self._container_name = container_name
-        self._image_name = f"{self._container_name}_image"
-        self._input_directory = input_dir
-        self._output_directory = output_dir
+        self._input_directory = _resolve_directory(os.path.abspath(input_dir))
+        self._output_directory = _resolve_directory(os.path.abspath(output_dir))
         self._port = port
         self._force_build = force_build
         self._cpu_only = cpu_only
+        self._image_exists_cache: Optional[bool] = None
+        self._status_cache = _NOT_CHECKED
+        self._tty_cache: Optional[bool] = None
+        self._api_client = _DockerAPIClient.from_env()
         self.__log_input()
 
+    @cached_property
+    def _image_name(self) -> str:
+        """
+        Builds the name of the image from container name on first use.
+
+        Returns:
+            str: The name of the image.
+        """
+        return f"{self._container_name}_image"
+
     @property
     def image_name(self):
         """
@@ -70,6 +113,8 @@ class DockerManager:
 
     def __log_input(self) -> None:
         """Log user input if debugging."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug("container_name: %s", self._container_name)
         logger.debug("image_name: %s", self._image_name)
         logger.debug("Input directory from user: %s", self._input_directory)
@@ -84,24 +129,35 @@ class DockerManager:
         Checks if the Docker image exists.
 
         This property calls a method that checks for the existence of the Docker
-        image associated with this instance.
+        image associated with this instance. Result is cached until the image is built.
+        Container inspection reports the container image too, so if the container
+        was already created from this image no separate image lookup is needed.
 
         Returns:
             bool: True if the Docker image exists, False otherwise.
         """
-        return self._check_image_exists()
+        if self._image_exists_cache is None:
+            self._load_container_state()
+        if self._image_exists_cache is None:
+            self._image_exists_cache = self._check_image_exists()
+        return self._image_exists_cache
 
     def _check_image_exists(self) -> bool:
         """
         Checks whether the Docker image already exists in the system.
+        Docker Engine API is asked directly if available, docker CLI otherwise.
 
         Returns:
             bool: True if the image exists, False otherwise.
         """
-        command = ["docker", "images", "-q", self._image_name]
-        process_output = subprocess.run(command, capture_output=True,
-                                        text=True, check=True).stdout.strip()
-        is_exists = process_output != ""
+        response = self._api_request("GET", f"/images/{quote(self._image_name)}/json")
+        if response is not None:
+            status_code, _ = response
+            return status_code == 200
+        command = ["docker", "image", "inspect", "--format={{.Id}}", self._image_name]
+        result = subprocess.run(command, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, check=False)
+        is_exists = result.returncode == 0
         return is_exists
 
     def build_image(self, dockerfile_path: str) -> None:
@@ -111,10 +167,11 @@ class DockerManager:
         Args:
             dockerfile_path (str): Path to the Dockerfile.
         """
-        if not self.docker_image_existence or self._force_build:
+        if self._force_build or not self.docker_image_existence:
             logging.info("Building Docker image...")
             command = ["docker", "build", "-t", self._image_name, dockerfile_path]
             subprocess.run(command, check=True)
+            self._image_exists_cache = True
         else:
             logger.info("Image is already created. Using existing one.")
 
@@ -122,24 +179,65 @@ class DockerManager:
     def container_status(self) -> str:
         """
         Retrieves the current status of the Docker container.
+        Result is cached until the container lifecycle is changed by this manager.
 
         Returns:
             str: Container status.
         """
-        return self._check_container_status()
+        self._load_container_state()
+        return self._status_cache
 
-    def _check_container_status(self) -> Optional[str]:
+    def _load_container_state(self) -> None:
+        """
+        Inspect the container once and cache its status. If the container was
+        created from this manager image, the image existence is cached as well.
+        """
+        if self._status_cache is not _NOT_CHECKED:
+            return
+        status, image, tty = self._inspect_container()
+        self._status_cache = status
+        self._tty_cache = tty
+        if image == self._image_name:
+            self._image_exists_cache = True
+
+    def _inspect_container(self) -> tuple[Optional[str], Optional[str], Optional[bool]]:
         """
-        Check the status of the container.
+        Check the status, the image and the TTY mode of the container with one docker call.
+        Docker Engine API is asked directly if available, docker CLI otherwise.
 
         Returns:
-            str: The status of the container.
+            tuple[Optional[str], Optional[str], Optional[bool]]: The status of the container,
+                the image it was created from and if it has TTY attached.
+                All None if container doesn't exist.
         """
-        command = ["docker", "inspect", "--format='{{.State.Status}}'", self._container_name]
+        response = self._api_request("GET", f"/containers/{quote(self._container_name)}/json")
+        if response is not None:
+            status_code, body = response
+            if status_code != 200:
+                return None, None, None
+            container = json.loads(body)
+            return (container["State"]["Status"], container["Config"]["Image"],
+                    container["Config"].get("Tty", False))
+        command = ["docker", "inspect",
+                   "--format='{{.State.Status}}|{{.Config.Image}}|{{.Config.Tty}}'",
+                   self._container_name]
         result = subprocess.run(command, capture_output=True, text=True, check=False)
         if result.returncode == 0:
-            return result.stdout.strip().replace("'", "")
-        return None
+            status, _, details = result.stdout.strip().replace("'", "").partition("|")
+            image, _, tty = details.partition("|")
+            return status, image, tty == "true" if tty else None
+        return None, None, None
+
+    def _is_container_tty(self) -> Optional[bool]:
+        """
+        Checks if the container has TTY attached. Result is cached with the container state.
+
+        Returns:
+            Optional[bool]: True if container has TTY, None if it can't be checked.
+        """
+        if self._tty_cache is None:
+            _, _, self._tty_cache = self._inspect_container()
+        return self._tty_cache
 
     def deploy_container(self, container_port: int, container_input_directory: str,
                          container_output_directory: str) -> None:
@@ -171,10 +269,17 @@ class DockerManager:
                             status)
 
     def _start_container(self) -> None:
-        """Start the container if it exists but stopped."""
+        """
+        Start the container if it exists but stopped.
+        Docker Engine API is asked directly if available, docker CLI otherwise.
+        """
         logging.info("Starting the existing container...")
-        command = ["docker", "start", self._container_name]
-        subprocess.run(command, check=True)
+        response = self._api_request("POST", f"/containers/{quote(self._container_name)}/start")
+        # 204 - container started, 304 - container already started
+        if response is None or response[0] not in (204, 304):
+            command = ["docker", "start", self._container_name]
+            subprocess.run(command, check=True)
+        self._status_cache = "running"
 
     def _run_container(self, container_port: int, container_input_directory: str,
                        container_output_directory: str) -> None:
@@ -198,21 +303,99 @@ class DockerManager:
             command.extend(["--gpus", "all"])
         command.append(self._image_name)
         subprocess.run(command, check=True)
+        self._status_cache = "running"
+        self._tty_cache = False  # container is run without -t
 
     def follow_container_logs(self) -> None:
-        """Starts following the logs of the running Docker container."""
+        """
+        Starts following the logs of the running Docker container.
+        Logs are passed to stdout as raw byte chunks, without decoding them line by line.
+        """
+        logs = None
         try:
-            process = self._run_log_process()
-            for line in iter(process.stdout.readline, ''):
-                sys.stdout.write(line)
-                if "Service ready for shutdown" in line:
+            logs = self._open_logs()
+            output = sys.stdout.buffer
+            tail = b""
+            for chunk in logs:
+                output.write(chunk)
+                output.flush()
+                # message can be split between many chunks, so tail keeps earlier context
+                tail += chunk
+                if self._SHUTDOWN_MESSAGE in tail:
                     raise self.ServiceShutdownSignal("Service has signaled readiness for shutdown.")
+                tail = tail[-len(self._SHUTDOWN_MESSAGE):]
         except KeyboardInterrupt:
             logger.info("Process stopped by user.")
         except self.ServiceShutdownSignal:
             logger.info("Service has signaled readiness for shutdown.")
         finally:
-            self.__stop_log_process(process)
+            self.__stop_following_logs(logs)
+
+    def _open_logs(self) -> Generator[bytes, None, None]:
+        """
+        Opens the stream of the container logs from the last second.
+        Docker Engine API is used if available, docker logs process otherwise.
+
+        Returns:
+            Generator: Generator yielding raw logs chunks.
+        """
+        since = int(time.time()) - 1
+        response = self._api_stream(
+            "GET", f"/containers/{quote(self._container_name)}/logs"
+                   f"?follow=1&stdout=1&stderr=1&since={since}")
+        if response is not None and response.status == 200:
+            logger.info("Following logs for %s...", self._container_name)
+            return self._read_api_logs(response, self._is_container_tty())
+        if response is not None:
+            response.close()
+        return self._read_process_logs(self._run_log_process())
+
+    def _read_api_logs(self, response: HTTPResponse,
+                       tty: Optional[bool]) -> Generator[bytes, None, None]:
+        """
+        Reads logs streamed by Docker Engine API until the stream is closed.
+        Containers without TTY stream logs in frames with 8 bytes headers
+        which last 4 bytes are the frame size, so headers are stripped.
+        Framing is decided by container TTY mode, because daemons older than API 1.42
+        label multiplexed logs as raw stream. Content type is used only if TTY mode is unknown.
+
+        Args:
+            response (HTTPResponse): Opened logs response.
+            tty (Optional[bool]): If container has TTY attached, None if unknown.
+
+        Yields:
+            bytes: Raw logs chunk.
+        """
+        if tty is None:
+            multiplexed = (response.getheader("Content-Type")
+                           == "application/vnd.docker.multiplexed-stream")
+        else:
+            multiplexed = not tty
+        try:
+            if multiplexed:
+                while len(header := response.read(8)) == 8:
+                    yield response.read(int.from_bytes(header[4:], "big"))
+            else:
+                yield from iter(lambda: response.read1(self._LOGS_CHUNK_SIZE), b"")
+        finally:
+            response.close()
+
+    def _read_process_logs(self, process: subprocess.Popen) -> Generator[bytes, None, None]:
+        """
+        Reads logs from the log following process until it ends
+        and terminates the process afterwards.
+
+        Args:
+            process (subprocess.Popen): The process object for the log following command.
+
+        Yields:
+            bytes: Raw logs chunk.
+        """
+        try:
+            yield from iter(lambda: process.stdout.read1(self._LOGS_CHUNK_SIZE), b"")
+        finally:
+            process.terminate()
+            process.wait()
 
     def _run_log_process(self) -> subprocess.Popen:
         """Initiates the process to follow Docker container logs.
@@ -223,32 +406,242 @@ class DockerManager:
         logger.info("Following logs for %s...", self._container_name)
         command = ["docker", "logs", "-f", "--since", "1s", self._container_name]
         process = subprocess.Popen(
-            command, stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT, text=True, encoding="utf-8"
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
         )
         return process
 
-    def __stop_log_process(self, process: subprocess.Popen) -> None:
-        """Terminates the log following process and stops the container.
+    def __stop_following_logs(self, logs: Optional[Generator[bytes, None, None]]) -> None:
+        """Closes the logs stream and stops the container.
 
         Args:
-            process (subprocess.Popen): The process object for the log following command.
+            logs (Optional[Generator]): Logs stream generator, if it was opened.
         """
         logger.info("Following container logs stopped.")
-        process.terminate()
-        process.wait()
+        if logs is not None:
+            logs.close()
         self._stop_container()
 
     def _stop_container(self) -> None:
-        """Stops the running Docker container."""
+        """
+        Stops the running Docker container.
+        Docker Engine API is asked directly if available, docker CLI otherwise.
+        """
         logger.info("Stopping container %s...", self._container_name)
-        command = ["docker", "stop", self._container_name]
-        subprocess.run(command, check=True, capture_output=True)
+        response = self._api_request(
+            "POST", f"/containers/{quote(self._container_name)}/stop?t={self._stop_timeout}")
+        # 204 - container stopped, 304 - container already stopped
+        if response is None or response[0] not in (204, 304):
+            command = ["docker", "stop", self._container_name]
+            subprocess.run(command, check=True, capture_output=True)
+        self._status_cache = "exited"
         logger.info("Container stopped.")
 
     def _delete_container(self) -> None:
-        """Deletes the Docker container."""
+        """
+        Deletes the Docker container.
+        Docker Engine API is asked directly if available, docker CLI otherwise.
+        """
         logger.info("Deleting container %s...", self._container_name)
-        command = ["docker", "rm", self._container_name]
-        subprocess.run(command, check=True, capture_output=True)
+        response = self._api_request("DELETE", f"/containers/{quote(self._container_name)}")
+        if response is None or response[0] != 204:
+            command = ["docker", "rm", self._container_name]
+            subprocess.run(command, check=True, capture_output=True)
+        self._status_cache = None
+        self._tty_cache = None
         logger.info("Container deleted.")
+
+    def _api_request(self, method: str, path: str) -> Optional[tuple[int, bytes]]:
+        """
+        Send request to the Docker Engine API if it is available.
+
+        Args:
+            method (str): HTTP method.
+            path (str): API endpoint path.
+
+        Returns:
+            Optional[tuple[int, bytes]]: Response status code and body.
+                None if API is unavailable and docker CLI should be used instead.
+        """
+        if self._api_client is None:
+            return None
+        try:
+            return self._api_client.request(method, path)
+        except _DockerAPIClient.APIUnavailableError as error:
+            logger.debug("Docker API unavailable, using docker CLI: %s", error)
+            self._api_client = None
+            return None
+
+    def _api_stream(self, method: str, path: str) -> Optional[HTTPResponse]:
+        """
+        Send request for long-lived streamed response to the Docker Engine API if it is available.
+
+        Args:
+            method (str): HTTP method.
+            path (str): API endpoint path.
+
+        Returns:
+            Optional[HTTPResponse]: Opened response, it must be closed by the caller.
+                None if API is unavailable and docker CLI should be used instead.
+        """
+        if self._api_client is None:
+            return None
+        try:
+            return self._api_client.stream(method, path)
+        except _DockerAPIClient.APIUnavailableError as error:
+            logger.debug("Docker API unavailable, using docker CLI: %s", error)
+            self._api_client = None
+            return None
+
+    def _reset_cache(self) -> None:
+        """Forgets cached docker state, e.g. after it was changed outside of this manager."""
+        self._image_exists_cache = None
+        self._status_cache = _NOT_CHECKED
+        self._tty_cache = None
+
+
+class _DockerAPIClient:
+    """
+    Minimal Docker Engine API client built on the standard library.
+    It keeps one connection to the daemon, so repeated calls don't pay
+    for starting docker CLI process and connecting to the daemon every time.
+    This is helper class for DockerManager class.
+    """
+    class APIUnavailableError(Exception):
+        """Error raised when Docker Engine API can't be reached."""
+
+    _default_socket_path = "/var/run/docker.sock"
+    _timeout = 60  # must be longer than container stop grace period
+
+    class _UnixHTTPConnection(HTTPConnection):
+        """HTTP connection over the docker daemon unix socket."""
+        def __init__(self, socket_path: str, timeout: float) -> None:
+            super().__init__("localhost", timeout=timeout)
+            self._socket_path = socket_path
+
+        def connect(self) -> None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self._socket_path)
+            self.sock = sock
+
+    def __init__(self, connection_factory: Callable[..., HTTPConnection]) -> None:
+        """
+        Initialize the client with not yet opened connection to the daemon.
+
+        Args:
+            connection_factory (Callable): Creates connection to the Docker Engine API
+                with given timeout.
+        """
+        self._connection_factory = connection_factory
+        self._connection = connection_factory(timeout=self._timeout)
+
+    @classmethod
+    def from_env(cls) -> Optional["_DockerAPIClient"]:
+        """
+        Create client for the daemon from DOCKER_HOST, the active docker context
+        or the default unix socket, the same way docker CLI chooses the daemon.
+
+        Returns:
+            Optional[_DockerAPIClient]: Client or None if daemon address is not supported
+                (e.g. TLS, ssh or Windows named pipe), then docker CLI should be used.
+        """
+        host = os.environ.get("DOCKER_HOST")
+        if host is None:
+            context = cls._get_current_context()
+            if context == "default":
+                host = f"unix://{cls._default_socket_path}"
+            else:
+                host = cls._get_context_host(context)
+                # TLS settings of context endpoint are not read, so only its socket is used
+                if host is None or urlsplit(host).scheme != "unix":
+                    logger.debug("Docker API client not supported for docker context: %s",
+                                 context)
+                    return None
+        address = urlsplit(host)
+        if address.scheme == "unix" and hasattr(socket, "AF_UNIX") \
+                and os.path.exists(address.path):
+            return cls(partial(cls._UnixHTTPConnection, address.path))
+        if address.scheme == "tcp" and not os.environ.get("DOCKER_TLS_VERIFY"):
+            return cls(partial(HTTPConnection, address.netloc))
+        logger.debug("Docker API client not supported for docker host: %s", host)
+        return None
+
+    @staticmethod
+    def _get_current_context() -> str:
+        """
+        Get the name of the docker context used by docker CLI, set by DOCKER_CONTEXT
+        or by 'docker context use' in docker CLI config file.
+
+        Returns:
+            str: Docker context name.
+        """
+        context = os.environ.get("DOCKER_CONTEXT")
+        if context:
+            return context
+        config_directory = os.environ.get("DOCKER_CONFIG", Path.home() / ".docker")
+        try:
+            with open(Path(config_directory) / "config.json", encoding="utf-8") as config_file:
+                return json.load(config_file).get("currentContext") or "default"
+        except (OSError, ValueError):
+            return "default"
+
+    @staticmethod
+    def _get_context_host(context: str) -> Optional[str]:
+        """
+        Get the daemon address of given docker context.
+
+        Args:
+            context (str): Docker context name.
+
+        Returns:
+            Optional[str]: Daemon address or None if context can't be inspected.
+        """
+        command = ["docker", "context", "inspect", "--format={{.Endpoints.docker.Host}}", context]
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+
+    def request(self, method: str, path: str) -> tuple[int, bytes]:
+        """
+        Send request to the Docker Engine API reusing the open connection.
+
+        Args:
+            method (str): HTTP method.
+            path (str): API endpoint path.
+
+        Returns:
+            tuple[int, bytes]: Response status code and body.
+
+        Raises:
+            APIUnavailableError: If request can't be sent or response can't be read.
+        """
+        try:
+            self._connection.request(method, path)
+            response = self._connection.getresponse()
+            return response.status, response.read()
+        except (OSError, HTTPException) as error:
+            self._connection.close()
+            raise self.APIUnavailableError(str(error)) from error
+
+    def stream(self, method: str, path: str) -> HTTPResponse:
+        """
+        Send request for long-lived streamed response on its own connection without timeout.
+
+        Args:
+            method (str): HTTP method.
+            path (str): API endpoint path.
+
+        Returns:
+            HTTPResponse: Opened response, it must be closed by the caller.
+
+        Raises:
+            APIUnavailableError: If request can't be sent or response can't be read.
+        """
+        connection = self._connection_factory(timeout=None)
+        try:
+            connection.request(method, path)
+            return connection.getresponse()
+        except (OSError, HTTPException) as error:
+            connection.close()
+            raise self.APIUnavailableError(str(error)) from error
@@ -31,31 +31,35 @@ logger = logging.getLogger(__name__)
 
 def main() -> None:
     """Script for starting extractor service and extraction process."""
-    user_input = parse_args()
+    config = Config()
+    user_input = parse_args(config)
     service = ServiceInitializer(user_input)
     docker = DockerManager(
-        Config.service_name,
+        config.service_name,
         user_input.input_dir,
         user_input.output_dir,
         user_input.port,
         user_input.build,
         user_input.cpu
     )
-    docker.build_image(Config.dockerfile)
+    docker.build_image(config.dockerfile)
     docker.deploy_container(
-        Config.port,
-        Config.volume_input_directory,
-        Config.volume_output_directory
+        config.port,
+        config.volume_input_directory,
+        config.volume_output_directory
     )
     service.run_extractor()
     docker.follow_container_logs()
     logger.info("Process stopped.")
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(config: Config) -> argparse.Namespace:
     """
     Parses command line arguments from user for extractor service.
 
+    Args:
+        config (Config): Configuration with default values for arguments.
+
     Returns:
         argparse.Namespace: Arguments from user.
     """
@@ -65,11 +69,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("extractor_name",
                         choices=["best_frames_extractor", "top_images_extractor"],
                         help="Name of extractor to run.")
-    parser.add_argument("--input_dir", "-i", default=Config.input_directory,
+    parser.add_argument("--input_dir", "-i", default=config.input_directory,
                         help="Full path to the extractors input directory.")
-    parser.add_argument("--output_dir", "-o", default=Config.output_directory,
+    parser.add_argument("--output_dir", "-o", default=config.output_directory,
                         help="Full path to the extractors output directory.")
-    parser.add_argument("--port", "-p", type=int, default=Config.port,
+    parser.add_argument("--port", "-p", type=int, default=config.port,
                         help="Port to expose the service on the host.")
     parser.add_argument("--build", "-b", action="store_true",
                         help="Forces the Docker image to be rebuilt if set to true.")
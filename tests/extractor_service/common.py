@@ -1,25 +1,14 @@
 """Common fixtures for all conftest files."""
 import pytest
 
-from extractor_service.app.dependencies import (ExtractorDependencies,
-                                                get_evaluator,
-                                                get_image_processor,
-                                                get_video_processor)
+from extractor_service.app.dependencies import EXTRACTOR_DEPENDENCIES
 from extractor_service.app.extractors import BestFramesExtractor
 from extractor_service.app.schemas import ExtractorConfig
 
 
 @pytest.fixture(scope="package")
 def dependencies():
-    image_processor = get_image_processor()
-    video_processor = get_video_processor()
-    evaluator = get_evaluator()
-
-    return ExtractorDependencies(
-        image_processor=image_processor,
-        video_processor=video_processor,
-        evaluator=evaluator
-    )
+    return EXTRACTOR_DEPENDENCIES
 
 
 @pytest.fixture(scope="package")
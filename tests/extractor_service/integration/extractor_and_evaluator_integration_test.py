@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 from tensorflow.keras import Model
 
-from extractor_service.app.image_evaluators import InceptionResNetNIMA
+from extractor_service.app.image_evaluators import (InceptionResNetNIMA,
+                                                    _ResNetModel)
 
 
 @pytest.mark.order(1)  # this test must be first because of hugging face limitations
@@ -15,7 +16,8 @@ def test_get_image_evaluator_download_weights_and_create_model(extractor, config
     evaluator = extractor._get_image_evaluator()
 
     assert isinstance(evaluator, InceptionResNetNIMA)
-    assert isinstance(evaluator._model, Model)
+    assert isinstance(_ResNetModel._model, Model)
+    assert callable(evaluator._predict)
     assert weights_path.exists()
 
 
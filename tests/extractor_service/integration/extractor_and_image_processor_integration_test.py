@@ -26,6 +26,7 @@ def test_save_images(extractor, config, setup_best_frames_extractor_env):
     files = extractor._list_input_directory_files(config.images_extensions)
     images = extractor._read_images(files)
     extractor._save_images(images)
+    extractor._wait_for_saved_images()
 
     files = list(config.output_directory.iterdir())
     assert files
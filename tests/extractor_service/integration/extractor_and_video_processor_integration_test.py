@@ -11,5 +11,6 @@ def test_extract_best_frames(extractor, config, setup_best_frames_extractor_env)
 
     extractor._get_image_evaluator()
     extractor._extract_best_frames(videos[0])
+    extractor._wait_for_saved_images()
 
     assert any(output_dir.iterdir()), "Output dir is empty."
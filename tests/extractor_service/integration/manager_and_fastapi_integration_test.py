@@ -1,4 +1,5 @@
-from fastapi import BackgroundTasks
+from unittest.mock import patch
+
 from starlette.testclient import TestClient
 
 from extractor_service.app.extractor_manager import ExtractorManager
@@ -7,11 +8,13 @@ from extractor_service.main import app
 client = TestClient(app)
 
 
-def test_extractor_start_and_stop(config, dependencies):
+@patch.object(ExtractorManager, "_executor")
+def test_extractor_start_and_stop(mock_executor, config, dependencies):
     extractor_name = "best_frames_extractor"
-    background_tasks = BackgroundTasks()
 
-    response = ExtractorManager.start_extractor(extractor_name, background_tasks, config, dependencies)
+    response = ExtractorManager.start_extractor(extractor_name, config, dependencies)
 
     assert response == f"'{extractor_name}' started."
-    assert ExtractorManager.get_active_extractor() is None
+    assert ExtractorManager.get_active_extractor() == extractor_name
+    mock_executor.submit.assert_called_once()
+    ExtractorManager._active_extractor = None
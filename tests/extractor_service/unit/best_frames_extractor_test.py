@@ -77,66 +77,103 @@ def test_process_if_all_frames(extractor, caplog, config, all_frames_extractor):
     assert f"Starting frames extraction process from '{config.input_directory}'." in caplog.text
 
 
-@patch("extractor_service.app.extractors.gc.collect")
+@patch.object(BestFramesExtractor, "_release_normalized_images")
 @patch.object(BestFramesExtractor, "_get_best_frames")
 @patch.object(BestFramesExtractor, "_save_images")
-@patch.object(OpenCVVideo, "get_next_frames")
-def test_extract_best_frames(mock_generator, mock_save, mock_get, mock_collect, extractor):
+@patch.object(BestFramesExtractor, "_get_frames_batches")
+def test_extract_best_frames(mock_batches, mock_save, mock_get, mock_release, extractor, caplog):
     video_path = MagicMock(spec=Path)
 
     batch_1 = [f"frame{i}" for i in range(5)]
-    batch_2 = []
-    batch_3 = [f"frame{i}" for i in range(5)]
-    mock_generator.return_value = iter([batch_1, batch_2, batch_3])
-
-    mock_get.side_effect = [batch_1, batch_3]
+    batch_2 = [f"frame{i}" for i in range(5)]
+    normalized_1, normalized_2 = MagicMock(), MagicMock()
+    mock_batches.return_value = (batch for batch in [(batch_1, normalized_1),
+                                                     (batch_2, normalized_2)])
+    mock_get.side_effect = [batch_1[:1], batch_2[:1]]
 
-    extractor._extract_best_frames(video_path)
+    with caplog.at_level(logging.INFO):
+        extractor._extract_best_frames(video_path)
 
-    assert not extractor._config.all_frames
-    mock_generator.assert_called_once_with(video_path, extractor._config.batch_size)
-    assert mock_get.call_count == 2
-    for batch in [batch_1, batch_3]:
-        mock_save.assert_called_with(batch)
-    assert mock_collect.call_count == 2
+    mock_batches.assert_called_once_with(video_path)
+    assert mock_get.call_args_list == [((batch_1, normalized_1),), ((batch_2, normalized_2),)]
+    assert mock_release.call_args_list == [((normalized_1,),), ((normalized_2,),)]
+    assert mock_save.call_args_list == [((batch_1[:1],),), ((batch_2[:1],),)]
+    assert "Frames extracted from video(2)." in caplog.text
 
 
-@patch("extractor_service.app.extractors.gc.collect")
 @patch.object(BestFramesExtractor, "_get_best_frames")
 @patch.object(BestFramesExtractor, "_save_images")
-@patch.object(OpenCVVideo, "get_next_frames")
-def test_extract_all_frames(mock_generator, mock_save, mock_get, mock_collect, all_frames_extractor):
+@patch.object(BestFramesExtractor, "_get_frames_batches")
+def test_extract_all_frames(mock_batches, mock_save, mock_get, all_frames_extractor):
     video_path = MagicMock(spec=Path)
 
+    batch_1 = [f"frame{i}" for i in range(5)]
+    batch_2 = [f"frame{i}" for i in range(5)]
+    mock_batches.return_value = (batch for batch in [(batch_1, None), (batch_2, None)])
+
+    all_frames_extractor._extract_best_frames(video_path)
+
+    mock_get.assert_not_called()
+    assert mock_save.call_args_list == [((batch_1,),), ((batch_2,),)]
+
+
+@patch.object(BestFramesExtractor, "_normalize_images")
+@patch.object(OpenCVVideo, "get_next_frames")
+def test_get_frames_batches(mock_generator, mock_normalize, extractor, config):
+    video_path = MagicMock(spec=Path)
     batch_1 = [f"frame{i}" for i in range(5)]
     batch_2 = []
     batch_3 = [f"frame{i}" for i in range(5)]
-    mock_generator.return_value = iter([batch_1, batch_2, batch_3])
+    mock_generator.return_value = (batch for batch in [batch_1, batch_2, batch_3])
 
-    all_frames_extractor._extract_best_frames(video_path)
+    batches = list(extractor._get_frames_batches(video_path))
 
-    assert all_frames_extractor._config.all_frames
-    mock_generator.assert_called_once_with(video_path, all_frames_extractor._config.batch_size)
-    assert mock_get.assert_not_called
-    for batch in [batch_1, batch_3]:
-        mock_save.assert_called_with(batch)
-    assert mock_collect.call_count == 2
+    mock_generator.assert_called_once_with(video_path, config.batch_size)
+    assert batches == [(batch_1, mock_normalize.return_value),
+                       (batch_3, mock_normalize.return_value)]
+    assert mock_normalize.call_args_list == [((batch_1, config.target_image_size),),
+                                             ((batch_3, config.target_image_size),)]
 
 
 @patch.object(BestFramesExtractor, "_normalize_images")
+@patch.object(OpenCVVideo, "get_next_frames")
+def test_get_frames_batches_if_all_frames(mock_generator, mock_normalize, all_frames_extractor):
+    batch = [f"frame{i}" for i in range(5)]
+    mock_generator.return_value = (batch for batch in [batch])
+
+    batches = list(all_frames_extractor._get_frames_batches(MagicMock(spec=Path)))
+
+    assert batches == [(batch, None)]
+    mock_normalize.assert_not_called()
+
+
 @patch.object(BestFramesExtractor, "_evaluate_images")
-def test_get_best_frames(mock_evaluate, mock_normalize, caplog, extractor, config):
+def test_get_best_frames(mock_evaluate, caplog, extractor, config):
     frames = [f"frames{i}" for i in range(10)]
     scores = np.array([7, 2, 9, 3, 8, 5, 10, 1, 4, 6])
-    normalized_images = [MagicMock() for _ in range(10)]
-    mock_normalize.return_value = normalized_images
+    normalized_images = MagicMock()
     mock_evaluate.return_value = scores
     expected_best_images = [frames[2], frames[6]]
 
-    with caplog.at_level(logging.INFO):
-        best_images = extractor._get_best_frames(frames)
+    with caplog.at_level(logging.DEBUG):
+        best_images = extractor._get_best_frames(frames, normalized_images)
 
     mock_evaluate.assert_called_once_with(normalized_images)
-    mock_normalize.assert_called_once_with(frames, config.target_image_size)
     assert best_images == expected_best_images
     assert f"Best frames selected({len(expected_best_images)})." in caplog.text
+
+
+@pytest.mark.parametrize("scores, expected_indices", (
+        ([7, 2, 9, 3, 8, 5, 10, 1, 4, 6, 3, 11], [2, 6, 11]),
+        ([1, 2], [1]),
+        ([5, 5, 5, 5, 5, 1], [0, 5]),
+))
+@patch.object(BestFramesExtractor, "_evaluate_images")
+def test_get_best_frames_with_smaller_last_group(mock_evaluate, scores, expected_indices,
+                                                 extractor):
+    frames = [f"frames{i}" for i in range(len(scores))]
+    mock_evaluate.return_value = np.array(scores)
+
+    best_images = extractor._get_best_frames(frames, MagicMock())
+
+    assert best_images == [frames[index] for index in expected_indices]
@@ -1,44 +1,97 @@
+import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import BackgroundTasks, HTTPException
+from fastapi import HTTPException
 
 from extractor_service.app.extractor_manager import ExtractorManager
 from extractor_service.app.extractors import ExtractorFactory
 
 
+@pytest.fixture(autouse=True)
+def reset_active_extractor():
+    ExtractorManager._active_extractor = None
+    yield
+    ExtractorManager._active_extractor = None
+
+
 def test_get_active_extractor():
     assert ExtractorManager.get_active_extractor() is None
 
 
+@patch.object(ExtractorManager, "_executor")
 @patch.object(ExtractorFactory, "create_extractor")
 @patch.object(ExtractorManager, "_check_is_already_extracting")
-def test_start_extractor(mock_checking, mock_create_extractor, config, dependencies):
+def test_start_extractor(mock_checking, mock_create_extractor, mock_executor,
+                         config, dependencies):
     extractor_name = "some_extractor"
     mock_extractor = MagicMock()
-    mock_background_tasks = MagicMock(spec=BackgroundTasks)
     mock_create_extractor.return_value = mock_extractor
 
-    message = ExtractorManager.start_extractor(extractor_name, mock_background_tasks, config, dependencies)
+    message = ExtractorManager.start_extractor(extractor_name, config, dependencies)
 
     mock_checking.assert_called_once()
     mock_create_extractor.assert_called_once_with(extractor_name, config, dependencies)
-    mock_background_tasks.add_task.assert_called_once_with(
+    mock_executor.submit.assert_called_once_with(
         ExtractorManager._ExtractorManager__run_extractor,
         mock_extractor,
         extractor_name
     )
     expected_message = f"'{extractor_name}' started."
     assert message == expected_message, "The return message does not match expected."
+    assert ExtractorManager.get_active_extractor() == extractor_name
+
+
+@patch.object(ExtractorManager, "_executor")
+@patch.object(ExtractorFactory, "create_extractor")
+def test_start_extractor_claims_extractor_before_task_runs(mock_create_extractor, mock_executor,
+                                                           config, dependencies):
+    ExtractorManager.start_extractor("first_extractor", config, dependencies)
+    with pytest.raises(HTTPException) as exc_info:
+        ExtractorManager.start_extractor("second_extractor", config, dependencies)
+
+    assert exc_info.value.status_code == 409
+    mock_create_extractor.assert_called_once()
+    mock_executor.submit.assert_called_once()
+
+
+@patch.object(ExtractorFactory, "create_extractor", side_effect=ValueError)
+def test_start_extractor_unknown_extractor_not_claimed(mock_create_extractor,
+                                                       config, dependencies):
+    with pytest.raises(ValueError):
+        ExtractorManager.start_extractor("unknown_extractor", config, dependencies)
+
+    assert ExtractorManager.get_active_extractor() is None
 
 
 @patch("extractor_service.app.extractors.BestFramesExtractor")
 def test_run_extractor(mock_extractor):
     extractor_name = "some_extractor"
 
+    ExtractorManager._active_extractor = extractor_name
+
     ExtractorManager._ExtractorManager__run_extractor(mock_extractor, extractor_name)
 
     mock_extractor.process.assert_called_once()
+    assert ExtractorManager.get_active_extractor() is None
+
+
+@patch("extractor_service.app.extractors.BestFramesExtractor")
+def test_run_extractor_failure_logged(mock_extractor, caplog):
+    extractor_name = "some_extractor"
+    ExtractorManager._active_extractor = extractor_name
+    mock_extractor.process.side_effect = ValueError("Broken extractor.")
+
+    with caplog.at_level(logging.ERROR):
+        ExtractorManager._ExtractorManager__run_extractor(mock_extractor, extractor_name)
+
+    assert f"Extractor '{extractor_name}' failed." in caplog.text
+    assert "Broken extractor." in caplog.text
+    assert ExtractorManager.get_active_extractor() is None
+
+
+def test_executor_runs_one_extraction_at_once():
+    assert ExtractorManager._executor._max_workers == 1
 
 
 def test_check_is_already_evaluating_true():
@@ -1,4 +1,6 @@
 import logging
+import threading
+import weakref
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,7 +9,8 @@ import pytest
 
 from extractor_service.app.extractors import (BestFramesExtractor,
                                               ExtractorFactory,
-                                              TopImagesExtractor)
+                                              TopImagesExtractor,
+                                              _list_directory_files)
 from extractor_service.app.image_evaluators import InceptionResNetNIMA
 from extractor_service.app.image_processors import OpenCVImage
 from extractor_service.app.video_processors import OpenCVVideo
@@ -51,90 +54,202 @@ def test_evaluate_images(extractor):
 
 
 @pytest.mark.parametrize("image", ("some_image", None))
-@patch.object(OpenCVImage, "read_image", return_value=None)
-@patch("extractor_service.app.extractors.ThreadPoolExecutor")
-def test_read_images(mock_executor, mock_read_image, image, extractor):
+@patch.object(OpenCVImage, "read_image")
+def test_read_images(mock_read_image, image, extractor):
     mock_paths = [MagicMock(spec=Path) for _ in range(3)]
-    mock_executor.return_value.__enter__.return_value = mock_executor
-    mock_executor.submit.return_value.result.return_value = image
-    calls = [
-        ((mock_read_image, path),)
-        for path in mock_paths
-    ]
+    mock_read_image.return_value = image
 
     result = extractor._read_images(mock_paths)
 
-    assert mock_executor.submit.call_count == len(mock_paths)
-    mock_executor.submit.assert_has_calls(calls, any_order=True)
-    assert mock_executor.submit.return_value.result.call_count == len(mock_paths)
+    assert mock_read_image.call_count == len(mock_paths)
+    for path in mock_paths:
+        mock_read_image.assert_any_call(path)
     if image:
-        assert result
+        assert result == [image] * len(mock_paths)
     else:
         assert not result
 
 
-@patch.object(OpenCVImage, "read_image", return_value=None)
-@patch("extractor_service.app.extractors.ThreadPoolExecutor")
-def test_save_images(mock_executor, mock_save_image, extractor, config):
+def test_io_executor_shared_between_extractors(config, dependencies):
+    first = BestFramesExtractor(config, dependencies.image_processor,
+                                dependencies.video_processor, dependencies.evaluator)
+    second = TopImagesExtractor(config, dependencies.image_processor,
+                                dependencies.video_processor, dependencies.evaluator)
+
+    assert first._io_executor is second._io_executor
+
+
+@pytest.fixture
+def saving_extractor(config, dependencies):
+    return BestFramesExtractor(
+        config, dependencies.image_processor,
+        dependencies.video_processor, dependencies.evaluator
+    )
+
+
+def test_save_images(saving_extractor, config):
     images = [MagicMock(spec=np.ndarray) for _ in range(3)]
-    mock_executor.return_value.__enter__.return_value = mock_executor
-    mock_executor.submit.return_value.result.return_value = None
+    saving_extractor._io_executor = MagicMock()
     calls = [
         ((OpenCVImage.save_image, image, config.output_directory, config.images_output_format),)
         for image in images
     ]
 
-    extractor._save_images(images)
+    saving_extractor._save_images(images)
+
+    assert saving_extractor._io_executor.submit.call_count == len(images)
+    saving_extractor._io_executor.submit.assert_has_calls(calls)
+    assert len(saving_extractor._pending_saves) == len(images)
+    saving_extractor._io_executor.submit.return_value.result.assert_not_called()
+
+
+def test_save_images_limits_pending_saves(saving_extractor, config):
+    images = [MagicMock(spec=np.ndarray) for _ in range(config.batch_size + 2)]
+    saving_extractor._io_executor = MagicMock()
+
+    saving_extractor._save_images(images)
+
+    assert len(saving_extractor._pending_saves) == config.batch_size
+    assert saving_extractor._io_executor.submit.return_value.result.call_count == 2
+
+
+def test_wait_for_saved_images(saving_extractor):
+    futures = [MagicMock() for _ in range(3)]
+    saving_extractor._pending_saves.extend(futures)
 
-    assert mock_executor.submit.call_count == len(images)
-    mock_executor.submit.assert_has_calls(calls, any_order=True)
-    assert mock_executor.submit.return_value.result.call_count == len(images)
+    saving_extractor._wait_for_saved_images()
+
+    assert not saving_extractor._pending_saves
+    for future in futures:
+        future.result.assert_called_once()
+
+
+@patch.object(OpenCVImage, "save_image")
+def test_save_images_in_background(mock_save_image, saving_extractor, config):
+    images = [MagicMock(spec=np.ndarray) for _ in range(3)]
+
+    saving_extractor._save_images(images)
+    saving_extractor._wait_for_saved_images()
+
+    assert mock_save_image.call_count == len(images)
+    for image in images:
+        mock_save_image.assert_any_call(image, config.output_directory,
+                                        config.images_output_format)
 
 
 @patch.object(OpenCVImage, "normalize_images")
-def test_normalize_images(mock_normalize, extractor, config):
+def test_normalize_images(mock_normalize, saving_extractor, config):
     images = [MagicMock() for _ in range(3)]
+    width, height = config.target_image_size
+
+    result = saving_extractor._normalize_images(images, config.target_image_size)
+
+    mock_normalize.assert_called_once()
+    assert mock_normalize.call_args.args[:2] == (images, config.target_image_size)
+    buffer = mock_normalize.call_args.args[2]
+    assert buffer.shape == (3, height, width, 3)
+    assert buffer.dtype == np.float32
+    assert result == mock_normalize.return_value
+
+
+def test_normalization_buffer_reused_after_release(saving_extractor, config):
+    first = saving_extractor._get_normalization_buffer(config.batch_size,
+                                                       config.target_image_size)
+    saving_extractor._release_normalized_images(first)
+
+    second = saving_extractor._get_normalization_buffer(2, config.target_image_size)
+
+    assert len(second) == 2
+    assert np.shares_memory(first, second)
+    assert not saving_extractor._normalization_buffers
+
+
+def test_normalization_buffer_not_reused_before_release(saving_extractor, config):
+    first = saving_extractor._get_normalization_buffer(2, config.target_image_size)
+    second = saving_extractor._get_normalization_buffer(2, config.target_image_size)
+
+    assert not np.shares_memory(first, second)
+
 
-    extractor._normalize_images(images, config.target_image_size)
+def test_normalization_buffer_reallocated_for_other_size(saving_extractor, config):
+    first = saving_extractor._get_normalization_buffer(2, config.target_image_size)
+    saving_extractor._release_normalized_images(first)
 
-    mock_normalize.assert_called_once_with(images, config.target_image_size)
+    second = saving_extractor._get_normalization_buffer(2, (112, 96))
 
+    assert second.shape == (2, 96, 112, 3)
+    assert not np.shares_memory(first, second)
 
-@patch.object(Path, "iterdir")
-@patch.object(Path, "is_file")
-def test_list_input_directory_files(mock_is_file, mock_iterdir, extractor, caplog, config):
-    mock_files = [Path("/fake/directory/file1.txt"), Path("/fake/directory/file2.log")]
+
+@pytest.fixture
+def listing_extractor(tmp_path, config, dependencies):
+    listing_config = config.model_copy(update={"input_directory": tmp_path})
+    return BestFramesExtractor(listing_config, dependencies.image_processor,
+                               dependencies.video_processor, dependencies.evaluator)
+
+
+def test_list_input_directory_files(listing_extractor, tmp_path, caplog):
+    mock_files = [tmp_path / "file1.txt", tmp_path / "file2.log"]
+    for file in mock_files:
+        file.touch()
+    (tmp_path / "image.jpg").touch()
+    (tmp_path / "directory.txt").mkdir()
     mock_extensions = (".txt", ".log")
-    mock_iterdir.return_value = mock_files
-    mock_is_file.return_value = True
 
     with caplog.at_level(logging.DEBUG):
-        result = extractor._list_input_directory_files(mock_extensions, None)
+        result = listing_extractor._list_input_directory_files(mock_extensions, None)
+
+    assert sorted(result) == mock_files
+    assert f"Directory '{tmp_path}' files listed." in caplog.text
+    assert f"Listed file paths: {result}" in caplog.text
+
+
+def test_list_input_directory_files_ignores_extensions_case(listing_extractor, tmp_path):
+    expected_files = [tmp_path / "IMAGE1.JPG", tmp_path / "image2.Jpg", tmp_path / "image3.jpg"]
+    for file in expected_files:
+        file.touch()
+    (tmp_path / "image4.png").touch()
+
+    result = listing_extractor._list_input_directory_files((".JPG",))
+
+    assert sorted(result) == expected_files
+
 
-    assert result == mock_files
-    assert f"Directory '{config.input_directory}' files listed." in caplog.text
-    assert f"Listed file paths: {mock_files}" in caplog.text
+def test_list_input_directory_files_without_prefixed(listing_extractor, tmp_path):
+    (tmp_path / "video.mp4").touch()
+    (tmp_path / "done_video.mp4").touch()
 
+    result = listing_extractor._list_input_directory_files((".mp4",), "done_")
 
-@patch.object(Path, "iterdir")
-def test_list_input_directory_files_no_files_found(mock_iterdir, extractor, caplog, config):
-    mock_files = []
+    assert result == [tmp_path / "video.mp4"]
+
+
+def test_list_input_directory_files_no_files_found(listing_extractor, tmp_path, caplog):
     mock_extensions = (".txt", ".log")
-    mock_iterdir.return_value = mock_files
     error_massage = (
         f"Files with extensions '{mock_extensions}' and "
-        f"without prefix 'Prefix not provided' not found in folder: {config.input_directory}."
+        f"without prefix 'Prefix not provided' not found in folder: {tmp_path}."
         f"\n-->HINT: You probably don't have input or you haven't changed prefixes. "
         f"\nCheck input directory."
     )
 
     with pytest.raises(BestFramesExtractor.EmptyInputDirectoryError), \
             caplog.at_level(logging.ERROR):
-        extractor._list_input_directory_files(mock_extensions)
+        listing_extractor._list_input_directory_files(mock_extensions)
 
     assert error_massage in caplog.text
 
 
+def test_list_directory_files(tmp_path):
+    (tmp_path / "video.mp4").touch()
+    (tmp_path / "done_video.mp4").touch()
+    (tmp_path / "image.jpg").touch()
+
+    result = _list_directory_files(tmp_path, (".mp4",), "done_")
+
+    assert result == (tmp_path / "video.mp4",)
+
+
 def test_add_prefix(extractor, caplog):
     test_prefix = "prefix_"
     test_path = Path("test_path/file.mp4")
@@ -150,6 +265,62 @@ def test_add_prefix(extractor, caplog):
     assert result == test_new_path
 
 
+def test_prefetch_yields_items_in_order(extractor):
+    items = [f"batch{i}" for i in range(5)]
+
+    result = list(extractor._prefetch(item for item in items))
+
+    assert result == items
+
+
+def test_prefetch_reraises_producer_error(extractor):
+    def failing_generator():
+        yield "batch"
+        raise ValueError("Broken video.")
+
+    prefetched = extractor._prefetch(failing_generator())
+
+    assert next(prefetched) == "batch"
+    with pytest.raises(ValueError, match="Broken video."):
+        next(prefetched)
+
+
+def test_prefetch_closes_generator_when_consumer_stops(extractor):
+    closed = threading.Event()
+
+    def endless_generator():
+        try:
+            while True:
+                yield "batch"
+        finally:
+            closed.set()
+
+    prefetched = extractor._prefetch(endless_generator())
+    next(prefetched)
+    prefetched.close()
+
+    assert closed.is_set()
+
+
+def test_prefetch_releases_consumed_item_while_producing_next(extractor):
+    resumed = threading.Event()
+    released = threading.Event()
+
+    def generator():
+        yield np.zeros(3)
+        resumed.set()
+        released.wait(timeout=1)
+        yield np.zeros(3)
+
+    prefetched = extractor._prefetch(generator())
+    item_reference = weakref.ref(next(prefetched))
+    assert resumed.wait(timeout=1)
+
+    assert item_reference() is None
+    released.set()
+    assert len(list(prefetched)) == 1
+
+
 def test_signal_readiness_for_shutdown(extractor, caplog):
     with caplog.at_level(logging.INFO):
         extractor._signal_readiness_for_shutdown()
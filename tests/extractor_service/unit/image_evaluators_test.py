@@ -1,5 +1,5 @@
 import logging
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -10,20 +10,20 @@ from extractor_service.app.image_evaluators import (InceptionResNetNIMA,
 
 @pytest.fixture
 def evaluator():
-    with patch.object(_ResNetModel, "get_model", return_value=MagicMock()):
+    with patch.object(_ResNetModel, "get_predict_function", return_value=MagicMock()):
         evaluator = InceptionResNetNIMA(MagicMock())
     return evaluator
 
 
-@patch.object(_ResNetModel, "get_model")
-def test_evaluator_initialization(mock_get_model, config):
-    test_model = "some_model"
-    mock_get_model.return_value = test_model
+@patch.object(_ResNetModel, "get_predict_function")
+def test_evaluator_initialization(mock_get_predict_function, config):
+    test_predict_function = "some_predict_function"
+    mock_get_predict_function.return_value = test_predict_function
 
     instance = InceptionResNetNIMA(config)
 
-    mock_get_model.assert_called_once()
-    assert instance._model == test_model
+    mock_get_predict_function.assert_called_once_with(config)
+    assert instance._predict == test_predict_function
 
 
 @patch("extractor_service.app.image_evaluators.convert_to_tensor")
@@ -33,21 +33,18 @@ def test_evaluate_images(mock_check, mock_calculate, mock_convert_to_tensor, eva
     fake_images = MagicMock(spec=np.ndarray)
     fake_images.shape = (3, 2, 2)
     tensor = "some_tensor"
-    predictions = [1.0, 2.0, 3.0]
+    predictions = np.ones((3, 10))
     expected_scores = [10.0, 20.0, 30.0]
     mock_convert_to_tensor.return_value = tensor
-    mock_calculate.side_effect = expected_scores
-    evaluator._model.predict.return_value = predictions
+    mock_calculate.return_value = np.array(expected_scores)
+    evaluator._predict.return_value.numpy.return_value = predictions
 
-    with caplog.at_level(logging.INFO):
+    with caplog.at_level(logging.DEBUG):
         result = evaluator.evaluate_images(fake_images)
 
     mock_convert_to_tensor.assert_called_once_with(fake_images)
-    evaluator._model.predict.assert_called_once_with(tensor, batch_size=fake_images.shape[0], verbose=0)
-    mock_calculate.assert_has_calls([
-        call(prediction, _ResNetModel._prediction_weights) for prediction in predictions],
-        any_order=True
-    )
+    evaluator._predict.assert_called_once_with(tensor)
+    mock_calculate.assert_called_once_with(predictions, _ResNetModel._prediction_weights)
     mock_check.assert_called_once()
     assert "Evaluating images..." in caplog.text
     assert "Images batch evaluated." in caplog.text
@@ -73,6 +70,19 @@ def test_calculate_weighted_mean_with_custom_weights(evaluator):
     assert np.isclose(calculated_mean, expected_weighted_mean)
 
 
+def test_calculate_weighted_mean_for_batch(evaluator):
+    predictions = np.random.default_rng(0).random((5, 10), dtype=np.float32)
+    weights = np.arange(1, 11, dtype=np.float32)
+    expected_weighted_means = [np.sum(prediction * weights) / np.sum(weights)
+                               for prediction in predictions]
+
+    calculated_means = evaluator._calculate_weighted_mean(predictions, weights)
+
+    assert calculated_means.shape == (5,)
+    assert calculated_means.dtype == np.float32
+    np.testing.assert_allclose(calculated_means, expected_weighted_means, rtol=1e-6)
+
+
 @pytest.mark.parametrize("score_len, images_len", ((1, 1), (1, 2)))
 def test_check_scores(score_len, images_len, evaluator, caplog):
     scores = [MagicMock(spec=np.ndarray) for _ in range(score_len)]
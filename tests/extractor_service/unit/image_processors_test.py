@@ -55,18 +55,18 @@ def test_save_image(mock_imwrite, mock_uuid, caplog):
     assert f"Image saved at '{expected_path}'." in caplog.text
 
 
-@patch.object(cv2, "resize")
-@patch.object(cv2, "cvtColor")
-@patch.object(np, "array")
-def test_normalize_images(mock_array, mock_cvt, mock_resize, caplog):
+@patch.object(cv2, "resize", wraps=cv2.resize)
+def test_normalize_images(mock_resize):
     images_num = 3
-    target_size = (112, 112)
-    batch_images = [MagicMock(spec=np.ndarray) for _ in range(images_num)]
-    resized_images = [MagicMock(spec=np.ndarray) for _ in range(images_num)]
-    expected_images = [MagicMock(spec=np.ndarray) for _ in range(images_num)]
-    mock_resize.side_effect = resized_images
-    mock_cvt.side_effect = expected_images
-    mock_array.return_value = np.array(expected_images, dtype=np.float32) / 255.0
+    target_size = (112, 96)
+    rng = np.random.default_rng(0)
+    batch_images = [rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)
+                    for _ in range(images_num)]
+    expected = np.array([
+        cv2.cvtColor(cv2.resize(image, target_size, interpolation=cv2.INTER_LANCZOS4),
+                     cv2.COLOR_BGR2RGB)
+        for image in batch_images
+    ], dtype=np.float32) / 255.0
 
     result = OpenCVImage.normalize_images(batch_images, target_size)
 
@@ -76,9 +76,18 @@ def test_normalize_images(mock_array, mock_cvt, mock_resize, caplog):
         interpolation=cv2.INTER_LANCZOS4
     ) for image in batch_images]
     mock_resize.assert_has_calls(calls, any_order=True)
-    calls = [call(
-        image,
-        cv2.COLOR_BGR2RGB
-    ) for image in resized_images]
-    mock_cvt.assert_has_calls(calls, any_order=True)
-    np.testing.assert_array_equal(result, mock_array.return_value)
+    assert result.dtype == np.float32
+    assert result.shape == (images_num, 96, 112, 3)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_normalize_images_into_given_array():
+    target_size = (112, 96)
+    rng = np.random.default_rng(0)
+    batch_images = [rng.integers(0, 256, (240, 320, 3), dtype=np.uint8) for _ in range(2)]
+    out = np.empty((2, 96, 112, 3), dtype=np.float32)
+
+    result = OpenCVImage.normalize_images(batch_images, target_size, out)
+
+    assert result is out
+    np.testing.assert_array_equal(out, OpenCVImage.normalize_images(batch_images, target_size))
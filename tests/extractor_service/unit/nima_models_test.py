@@ -1,9 +1,13 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import requests
+import tensorflow as tf
 
 from extractor_service.app.image_evaluators import _ResNetModel
 
@@ -25,7 +29,8 @@ def test_get_prediction_weights():
 @patch("extractor_service.app.image_evaluators.Dropout")
 @patch("extractor_service.app.image_evaluators.Dense")
 @patch("extractor_service.app.image_evaluators.Model")
-def test_create_model(mock_model, mock_dense, mock_dropout, mock_resnet, caplog):
+def test_create_model(mock_model, mock_dense, mock_dropout, mock_resnet, config, caplog):
+    _ResNetModel._config = config
     model_weights_path = Path("/fake/path/to/weights.h5")
     model_inputs = "mock_input"
     model_outputs = "mock_output"
@@ -51,18 +56,76 @@ def test_create_model(mock_model, mock_dense, mock_dropout, mock_resnet, caplog)
 
     mock_resnet.assert_called_once_with(input_shape=(224, 224, 3), include_top=False, pooling="avg", weights=None)
     mock_dropout.assert_called_once_with(_ResNetModel._dropout_rate)
-    mock_dense.assert_called_once_with(_ResNetModel._num_classes, activation="softmax")
+    mock_dense.assert_called_once_with(_ResNetModel._num_classes, activation="softmax",
+                                       dtype="float32")
     mock_model.assert_called_once_with(inputs=model_inputs, outputs=final_output)
     mock_model_instance.load_weights.assert_called_once_with(model_weights_path)
     assert "Model loaded successfully." in caplog.text
     assert model == mock_model_instance
 
 
+@patch.object(_ResNetModel, "_get_dtype_policy", return_value="mixed_float16")
+@patch("extractor_service.app.image_evaluators.tf.keras.mixed_precision.set_global_policy")
+@patch("extractor_service.app.image_evaluators.tf.keras.mixed_precision.global_policy")
+@patch("extractor_service.app.image_evaluators.tf.keras.applications.InceptionResNetV2")
+def test_create_model_restores_dtype_policy(mock_resnet, mock_global_policy,
+                                            mock_set_policy, mock_get_policy):
+    mock_resnet.side_effect = ValueError("Broken model.")
+
+    with pytest.raises(ValueError):
+        _ResNetModel._create_model(Path("/fake/path/to/weights.h5"))
+
+    assert mock_set_policy.call_args_list == [
+        (("mixed_float16",),), ((mock_global_policy.return_value,),)
+    ]
+
+
+@pytest.mark.parametrize("compute_capabilities, cpu_mixed_precision, cpu_bfloat16, expected", (
+        ([], True, False, "float32"),
+        ([], True, True, "mixed_bfloat16"),
+        ([], False, True, "float32"),
+        ([(6, 1)], True, True, "float32"),
+        ([(6, 1), (8, 6)], False, True, "mixed_float16"),
+))
+@patch.object(_ResNetModel, "_cpu_supports_bfloat16")
+@patch("extractor_service.app.image_evaluators.tf.config.experimental.get_device_details")
+@patch("extractor_service.app.image_evaluators.tf.config.list_physical_devices")
+def test_get_dtype_policy(mock_devices, mock_details, mock_cpu_bfloat16,
+                          compute_capabilities, cpu_mixed_precision, cpu_bfloat16, expected):
+    _ResNetModel._config = MagicMock(cpu_mixed_precision=cpu_mixed_precision)
+    mock_devices.return_value = [MagicMock() for _ in compute_capabilities]
+    mock_details.side_effect = [{"compute_capability": capability}
+                                for capability in compute_capabilities]
+    mock_cpu_bfloat16.return_value = cpu_bfloat16
+
+    result = _ResNetModel._get_dtype_policy()
+
+    mock_devices.assert_called_once_with("GPU")
+    assert result == expected
+
+
+@pytest.mark.parametrize("flags, expected", (
+        ("fpu sse2 avx2 avx512f", False),
+        ("fpu avx512f avx512_bf16", True),
+        ("fpu amx_bf16 amx_tile", True),
+))
+def test_cpu_supports_bfloat16(flags, expected, tmp_path):
+    cpu_info_path = tmp_path / "cpuinfo"
+    cpu_info_path.write_text(f"processor\t: 0\nflags\t\t: {flags}\n\nprocessor\t: 1\n")
+
+    assert _ResNetModel._cpu_supports_bfloat16(cpu_info_path) is expected
+
+
+def test_cpu_supports_bfloat16_without_cpu_info(tmp_path):
+    assert _ResNetModel._cpu_supports_bfloat16(tmp_path / "missing") is False
+
+
 def test_class_arguments():
     model = _ResNetModel
     assert model._config is None
     assert model._model is None
     assert list(model._prediction_weights) == list(np.arange(1, 11))
+    assert model._prediction_weights.dtype == np.float32
     assert model._input_shape == (224, 224, 3)
     assert np.isclose(model._dropout_rate, 0.75, rtol=1e-9)
     assert model._num_classes == 10
@@ -71,11 +134,13 @@ def test_class_arguments():
 def test_reset(config):
     model = "some_model"
     _ResNetModel._model = model
+    _ResNetModel._predict_function = "some_function"
     _ResNetModel._config = config
 
     _ResNetModel.reset()
 
     assert _ResNetModel._model is None
+    assert _ResNetModel._predict_function is None
     assert _ResNetModel._config is None
 
 
@@ -108,6 +173,40 @@ def test_get_model(mock_create, mock_get_weights, had_model, config):
         assert result == model
 
 
+@patch.object(_ResNetModel, "_get_model_weights")
+@patch.object(_ResNetModel, "_create_model")
+def test_get_model_created_once_for_concurrent_calls(mock_create, mock_get_weights, config):
+    def slow_create_model(weights_path):
+        time.sleep(0.05)
+        return MagicMock()
+
+    mock_create.side_effect = slow_create_model
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        models = list(executor.map(lambda _: _ResNetModel.get_model(config), range(4)))
+
+    mock_create.assert_called_once()
+    assert all(model is models[0] for model in models)
+
+
+@patch.object(_ResNetModel, "get_model")
+def test_get_predict_function(mock_get_model, config):
+    inputs = tf.keras.Input((4, 4, 3))
+    outputs = tf.keras.layers.Dense(10, activation="softmax")(
+        tf.keras.layers.GlobalAveragePooling2D()(inputs))
+    model = tf.keras.Model(inputs, outputs)
+    mock_get_model.return_value = model
+    images = np.random.default_rng(0).random((3, 4, 4, 3), dtype=np.float32)
+
+    predict = _ResNetModel.get_predict_function(config)
+    predictions = predict(tf.convert_to_tensor(images)).numpy()
+
+    mock_get_model.assert_called_once_with(config)
+    np.testing.assert_allclose(predictions, model.predict(images, verbose=0), rtol=1e-6)
+    assert predict(tf.convert_to_tensor(images[:1])).shape == (1, 10)
+    assert _ResNetModel.get_predict_function(config) is predict
+    mock_get_model.assert_called_once()
+
+
 @pytest.mark.parametrize("file_exists", (True, False))
 @patch.object(Path, "is_file")
 @patch.object(_ResNetModel, "_download_model_weights")
@@ -132,26 +231,27 @@ def test_get_model_weights(mock_download, mock_is_file, file_exists, caplog):
 
 
 @pytest.mark.parametrize("status_code", (200, 404))
-@patch.object(Path, "write_bytes")
-@patch("extractor_service.app.image_evaluators.requests.get")
-@patch.object(Path, "mkdir")
-def test_download_model_weights_success(mock_mkdir, mock_get, mock_write_bytes, status_code, caplog):
+@patch("extractor_service.app.image_evaluators.requests.Session")
+def test_download_model_weights(mock_session, status_code, tmp_path, caplog):
     test_url = "https://example.com/weights.h5"
-    test_path = Path("/fake/path/to/weights.h5")
-    _ResNetModel._config = MagicMock(weights_repo_url="https://example.com/", weights_filename="weights.h5")
-    weights_data = b"weights data"
+    test_path = tmp_path / "weights" / "weights.h5"
+    _ResNetModel._config = MagicMock(weights_repo_url="https://example.com/",
+                                     weights_filename="weights.h5")
+    weights_chunks = [b"weights ", b"data"]
     timeout = 12
 
-    mock_response = MagicMock()
+    mock_get = mock_session.return_value.__enter__.return_value.get
+    mock_response = mock_get.return_value.__enter__.return_value
     mock_response.status_code = status_code
-    mock_response.content = weights_data
-    mock_get.return_value = mock_response
+    mock_response.iter_content.return_value = iter(weights_chunks)
 
     if status_code == 200:
         with caplog.at_level(logging.DEBUG):
             _ResNetModel._download_model_weights(test_path, timeout)
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-        mock_write_bytes.assert_called_once_with(weights_data)
+        mock_response.iter_content.assert_called_once_with(
+            chunk_size=_ResNetModel._download_chunk_size)
+        assert test_path.read_bytes() == b"weights data"
+        assert list(test_path.parent.iterdir()) == [test_path]
         assert f"Model weights downloaded and saved to {test_path}" in caplog.text
     else:
         error_message = f"Failed to download the weights: HTTP status code {status_code}"
@@ -159,5 +259,32 @@ def test_download_model_weights_success(mock_mkdir, mock_get, mock_write_bytes,
                 pytest.raises(_ResNetModel.DownloadingModelWeightsError, match=error_message):
             _ResNetModel._download_model_weights(test_path, timeout)
         assert "Failed to download the weights: HTTP status code 404" in caplog.text
+        assert not test_path.parent.exists()
     assert f"Downloading model weights from ulr: {test_url}" in caplog.text
-    mock_get.assert_called_once_with(test_url, allow_redirects=True, timeout=timeout)
+    mock_get.assert_called_once_with(test_url, allow_redirects=True, timeout=timeout, stream=True)
+    mock_mount = mock_session.return_value.__enter__.return_value.mount
+    mock_mount.assert_called_once()
+    mounted_url, adapter = mock_mount.call_args.args
+    assert mounted_url == test_url
+    assert adapter.max_retries is _ResNetModel._download_retries
+
+
+@patch("extractor_service.app.image_evaluators.requests.Session")
+def test_download_model_weights_interrupted(mock_session, tmp_path):
+    test_path = tmp_path / "weights.h5"
+    _ResNetModel._config = MagicMock(weights_repo_url="https://example.com/",
+                                     weights_filename="weights.h5")
+
+    def interrupted_chunks():
+        yield b"weights "
+        raise requests.ConnectionError("Connection lost.")
+
+    mock_get = mock_session.return_value.__enter__.return_value.get
+    mock_response = mock_get.return_value.__enter__.return_value
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = interrupted_chunks()
+
+    with pytest.raises(requests.ConnectionError):
+        _ResNetModel._download_model_weights(test_path)
+
+    assert not test_path.exists()
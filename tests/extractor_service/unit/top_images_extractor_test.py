@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import numpy as np
@@ -18,20 +19,19 @@ def extractor(config):
     return extractor
 
 
-@patch.object(OpenCVImage, "read_image")
-@patch.object(TopImagesExtractor, "_normalize_images")
-def test_process_with_images(mock_normalize, mock_read_image, extractor, caplog, config):
+def test_process_with_images(extractor, caplog, config):
     # Setup
     test_images = [
         "/fake/directory/image1.jpg", "/fake/directory/image2.jpg", "/fake/directory/image3.jpg"]
-    test_ratings = [10, 20, 30]
-    best_image = ["image3.jpg"]
+    test_ratings = np.array([10, 20, 30])
+    best_image = ["/fake/directory/image3.jpg"]
 
     # Mock internal methods
     extractor._list_input_directory_files = MagicMock(return_value=test_images)
     extractor._get_image_evaluator = MagicMock()
-    extractor._evaluate_images = MagicMock(return_value=test_ratings)
+    extractor._rate_images = MagicMock(return_value=(test_images, test_ratings))
     extractor._get_top_percent_images = MagicMock(return_value=best_image)
+    extractor._read_images = MagicMock()
     extractor._save_images = MagicMock()
     extractor._signal_readiness_for_shutdown = MagicMock()
 
@@ -42,12 +42,11 @@ def test_process_with_images(mock_normalize, mock_read_image, extractor, caplog,
     # Check that the internal methods were called as expected
     extractor._list_input_directory_files.assert_called_once_with(
         extractor._config.images_extensions)
-    mock_read_image.assert_has_calls([call(path) for path in test_images])
-    mock_normalize.assert_called_once_with([mock_read_image.return_value]*3, extractor._config.target_image_size)
-    extractor._evaluate_images.assert_called_once_with(mock_normalize.return_value)
+    extractor._rate_images.assert_called_once_with(test_images)
     extractor._get_top_percent_images.assert_called_once_with(
-        [mock_read_image.return_value]*3, test_ratings, extractor._config.top_images_percent)
-    extractor._save_images.assert_called_once_with(best_image)
+        test_images, test_ratings, extractor._config.top_images_percent)
+    extractor._read_images.assert_called_once_with(best_image)
+    extractor._save_images.assert_called_once_with(extractor._read_images.return_value)
 
     # Check logging
     expected_massage = (
@@ -55,17 +54,82 @@ def test_process_with_images(mock_normalize, mock_read_image, extractor, caplog,
         f" All top images extracted from directory: {config.input_directory}."
     )
     assert expected_massage in caplog.text
+    assert f"Top images selected({len(best_image)})." in caplog.text
+    extractor._signal_readiness_for_shutdown.assert_called_once()
+
+
+def test_process_without_images(extractor, caplog):
+    extractor._list_input_directory_files = MagicMock(return_value=[])
+    extractor._get_image_evaluator = MagicMock()
+    extractor._get_top_percent_images = MagicMock()
+    extractor._save_images = MagicMock()
+    extractor._signal_readiness_for_shutdown = MagicMock()
+
+    with caplog.at_level(logging.INFO):
+        extractor.process()
+
+    extractor._get_top_percent_images.assert_not_called()
+    extractor._save_images.assert_not_called()
+    assert "Top images selected(0)." in caplog.text
     extractor._signal_readiness_for_shutdown.assert_called_once()
 
 
+def test_rate_images(extractor):
+    paths = [Path(f"image{i}.jpg") for i in range(5)]
+    normalized_1, normalized_2 = MagicMock(), MagicMock()
+    extractor._get_images_batches = MagicMock(return_value=(
+        batch for batch in [(paths[:3], normalized_1), (paths[4:], normalized_2)]
+    ))
+    extractor._evaluate_images = MagicMock(side_effect=[np.array([1, 2, 3]), np.array([4])])
+    extractor._release_normalized_images = MagicMock()
+
+    rated_paths, scores = extractor._rate_images(paths)
+
+    extractor._get_images_batches.assert_called_once_with(paths)
+    assert extractor._evaluate_images.call_args_list == [call(normalized_1), call(normalized_2)]
+    assert extractor._release_normalized_images.call_args_list == [
+        call(normalized_1), call(normalized_2)]
+    assert rated_paths == paths[:3] + paths[4:]
+    np.testing.assert_array_equal(scores, [1, 2, 3, 4])
+
+
+@patch.object(TopImagesExtractor, "_normalize_images")
+@patch.object(OpenCVImage, "read_image")
+def test_get_images_batches(mock_read_image, mock_normalize, extractor, config):
+    paths = [Path(f"image{i}.jpg") for i in range(config.batch_size + 2)]
+    images = {path: f"image_{path}" for path in paths}
+    unreadable = {paths[1], paths[-2], paths[-1]}
+    mock_read_image.side_effect = lambda path: None if path in unreadable else images[path]
+
+    batches = list(extractor._get_images_batches(paths))
+
+    expected_paths = [path for path in paths[:config.batch_size] if path not in unreadable]
+    assert batches == [(expected_paths, mock_normalize.return_value)]
+    mock_normalize.assert_called_once_with([images[path] for path in expected_paths],
+                                           config.target_image_size)
+
+
 def test_get_top_percent_images(extractor, caplog):
     images = [MagicMock(spec=np.ndarray) for _ in range(5)]
     ratings = np.array([55, 70, 85, 40, 20])
-    top_percent = 70
+    top_percent = 30
     expected_images = [images[1], images[2]]
 
-    with caplog.at_level(logging.INFO):
+    with caplog.at_level(logging.DEBUG):
         selected_images = extractor._get_top_percent_images(images, ratings, top_percent)
 
     assert selected_images == expected_images, "The selected images do not match the expected top percent images."
     assert f"Top images selected({len(expected_images)})." in caplog.text
+
+
+@pytest.mark.parametrize("top_percent", (0, 33.3, 50, 70, 90, 100))
+def test_get_top_percent_images_matches_percentile(top_percent):
+    rng = np.random.default_rng(0)
+    for scores in (rng.random(37), rng.integers(0, 5, 40).astype(float), np.array([4.2])):
+        images = [f"image{i}" for i in range(len(scores))]
+        threshold = np.percentile(scores, 100 - top_percent)
+        expected_images = [image for image, score in zip(images, scores) if score >= threshold]
+
+        selected_images = TopImagesExtractor._get_top_percent_images(images, scores, top_percent)
+
+        assert selected_images == expected_images
@@ -53,9 +53,11 @@ def mock_video():
 ])
 @patch.object(OpenCVVideo, '_video_capture')
 @patch.object(OpenCVVideo, '_get_video_attribute')
+@patch.object(OpenCVVideo, '_seek_frame', return_value=True)
+@patch.object(OpenCVVideo, '_skip_to_frame')
 @patch.object(OpenCVVideo, '_read_next_frame')
-def test_get_next_video_frames(mock_read, mock_get_attribute, mock_video_cap,
-                               batch_size, expected_num_batches, caplog):
+def test_get_next_video_frames(mock_read, mock_skip, mock_seek, mock_get_attribute,
+                               mock_video_cap, batch_size, expected_num_batches, caplog):
     frame_rate_attr = "frame rate"
     video_path = MagicMock()
     mock_video = MagicMock()
@@ -77,6 +79,8 @@ def test_get_next_video_frames(mock_read, mock_get_attribute, mock_video_cap,
     mock_get_attribute.assert_any_call(mock_video, cv2.CAP_PROP_FPS, frame_rate_attr)
     mock_get_attribute.assert_any_call(mock_video, cv2.CAP_PROP_FRAME_COUNT, TOTAL_FRAMES_ATTR)
     assert mock_read.call_count == 3
+    assert mock_seek.call_count == 3
+    mock_skip.assert_not_called()
 
     assert "Frame appended to frames batch." in caplog.text
     assert "Got full frames batch." in caplog.text
@@ -84,6 +88,126 @@ def test_get_next_video_frames(mock_read, mock_get_attribute, mock_video_cap,
         assert "Returning last frames batch." in caplog.text
 
 
+@patch.object(OpenCVVideo, '_video_capture')
+@patch.object(OpenCVVideo, '_get_video_attribute', side_effect=[2, 6])
+@patch.object(OpenCVVideo, '_seek_frame', return_value=False)
+@patch.object(OpenCVVideo, '_skip_to_frame')
+@patch.object(OpenCVVideo, '_grab_frames')
+@patch.object(OpenCVVideo, '_read_next_frame')
+def test_get_next_video_frames_not_seekable(mock_read, mock_grab, mock_skip, mock_seek,
+                                            mock_get_attribute, mock_video_cap):
+    mock_video = MagicMock()
+    mock_video_cap.return_value.__enter__.return_value = mock_video
+    video_path = MagicMock()
+
+    batches = list(OpenCVVideo.get_next_frames(video_path, 3))
+
+    assert len(batches) == 1
+    mock_seek.assert_called_once_with(mock_video, 0)
+    mock_skip.assert_called_once_with(mock_video, 0, video_path)
+    assert mock_grab.call_args_list == [((mock_video, 1),), ((mock_video, 1),)]
+
+
+@patch.object(OpenCVVideo, '_video_capture')
+@patch.object(OpenCVVideo, '_get_video_attribute', side_effect=[1, 3])
+@patch.object(OpenCVVideo, '_seek_frame', return_value=True)
+@patch.object(OpenCVVideo, '_read_next_frame', side_effect=["frame0", None, "frame2"])
+def test_get_next_video_frames_skips_unread_frames(mock_read, mock_seek,
+                                                   mock_get_attribute, mock_video_cap):
+    batches = list(OpenCVVideo.get_next_frames(MagicMock(), 3))
+
+    assert batches == [["frame0", "frame2"]]
+
+
+@patch.object(OpenCVVideo, '_video_capture')
+@patch.object(OpenCVVideo, '_get_video_attribute', side_effect=[1, 10])
+@patch.object(OpenCVVideo, '_seek_frame', return_value=True)
+@patch.object(OpenCVVideo, '_read_next_frame',
+              side_effect=["frame0", None, "frame2"] + [None] * 7)
+def test_get_next_video_frames_consecutive_failed_reads(mock_read, mock_seek,
+                                                        mock_get_attribute, mock_video_cap,
+                                                        caplog):
+    with pytest.raises(OpenCVVideo.VideoCaptureClosed), caplog.at_level(logging.ERROR):
+        list(OpenCVVideo.get_next_frames(MagicMock(), 3))
+
+    assert mock_read.call_count == 3 + OpenCVVideo._MAX_CONSECUTIVE_FAILED_READS
+    assert "Couldn't read 5 consecutive frames from video" in caplog.text
+
+
+@pytest.mark.parametrize("set_return, position, expected", (
+        (True, 30.0, True),
+        (True, 0.0, False),
+        (False, 0.0, False),
+))
+def test_seek_frame(set_return, position, expected, caplog):
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.set.return_value = set_return
+    mock_cap.get.return_value = position
+    frame_index = 30
+
+    with caplog.at_level(logging.WARNING):
+        result = OpenCVVideo._seek_frame(mock_cap, frame_index)
+
+    mock_cap.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, frame_index)
+    assert result is expected
+    if not expected:
+        assert f"Can't seek video to frame with index: {frame_index}." in caplog.text
+
+
+@pytest.mark.parametrize("grab_results, expected_grabs", (
+        ([True] * 3, 3),
+        ([True, False], 2),
+))
+def test_grab_frames(grab_results, expected_grabs):
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.grab.side_effect = grab_results
+
+    OpenCVVideo._grab_frames(mock_cap, 3)
+
+    assert mock_cap.grab.call_count == expected_grabs
+
+
+@pytest.mark.parametrize("grab_results, expected_grabs", (
+        ([True] * 3, 3),
+        ([True, False], 2),
+))
+def test_skip_to_frame(grab_results, expected_grabs):
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.get.return_value = 2.0
+    mock_cap.grab.side_effect = grab_results
+
+    OpenCVVideo._skip_to_frame(mock_cap, 5, Path("video.mp4"))
+
+    mock_cap.get.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES)
+    mock_cap.open.assert_not_called()
+    assert mock_cap.grab.call_count == expected_grabs
+
+
+def test_skip_to_frame_overshot_position(caplog):
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.get.return_value = 8.0
+    mock_cap.open.return_value = True
+    mock_cap.grab.return_value = True
+
+    with caplog.at_level(logging.WARNING):
+        OpenCVVideo._skip_to_frame(mock_cap, 5, Path("video.mp4"))
+
+    mock_cap.open.assert_called_once_with("video.mp4")
+    assert mock_cap.grab.call_count == 5
+    assert "Video position 8 is past frame with index: 5. Reopening video." in caplog.text
+
+
+def test_skip_to_frame_overshot_position_cant_reopen():
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.get.return_value = 8.0
+    mock_cap.open.return_value = False
+
+    with pytest.raises(OpenCVVideo.CantOpenVideoCapture):
+        OpenCVVideo._skip_to_frame(mock_cap, 5, Path("video.mp4"))
+
+    mock_cap.grab.assert_not_called()
+
+
 @pytest.mark.parametrize("read_return", ((True, "frame"), (False, None)))
 @patch.object(OpenCVVideo, "_check_video_capture")
 def test_read_next_frame(mock_check_cap, read_return, caplog):
@@ -93,16 +217,26 @@ def test_read_next_frame(mock_check_cap, read_return, caplog):
     with caplog.at_level(logging.WARNING):
         result = OpenCVVideo._read_next_frame(mock_cap, test_frame_index)
 
-    mock_check_cap.assert_called_once_with(mock_cap)
-    mock_cap.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, test_frame_index)
+    mock_cap.set.assert_not_called()
     mock_cap.read.assert_called_once()
     if read_return[0] is True:
         assert result == "frame"
+        mock_check_cap.assert_not_called()
     else:
         assert result is None
+        mock_check_cap.assert_called_once_with(mock_cap)
         assert f"Couldn't read frame with index: {test_frame_index}" in caplog.text
 
 
+def test_read_next_frame_closed_capture():
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.read.return_value = (False, None)
+    mock_cap.isOpened.return_value = False
+
+    with pytest.raises(ValueError):
+        OpenCVVideo._read_next_frame(mock_cap, 1)
+
+
 @patch.object(OpenCVVideo, "_check_video_capture")
 def test_get_video_attribute(mock_check_cap, caplog):
     mock_cap = MagicMock(spec=cv2.VideoCapture)
@@ -21,6 +21,7 @@ def cleanup_container(client, manager, config):
         container.remove(force=True)
     except docker.errors.NotFound:
         pass
+    manager._reset_cache()
     yield
     try:
         container = client.containers.get(manager._container_name)
@@ -77,6 +78,7 @@ def test_container_status(manager, cleanup_container, client, image):
     container.start()
     container.reload()
     assert container.status == "running"
+    manager._reset_cache()
     assert manager.container_status == "running"
 
 
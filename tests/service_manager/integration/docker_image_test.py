@@ -1,8 +1,6 @@
 import docker
 import pytest
 
-from config import Config
-
 
 @pytest.fixture
 def cleanup_docker_image(manager, client):
@@ -11,6 +9,7 @@ def cleanup_docker_image(manager, client):
         client.images.remove(image_name, force=True)
     except docker.errors.ImageNotFound:
         pass
+    manager._reset_cache()
 
     yield
 
@@ -20,8 +19,8 @@ def cleanup_docker_image(manager, client):
         pass
 
 
-def test_build_image_and_docker_image_existence(cleanup_docker_image, manager, client):
-    manager.build_image(Config.dockerfile)
+def test_build_image_and_docker_image_existence(cleanup_docker_image, manager, client, config):
+    manager.build_image(config.dockerfile)
 
     try:
         client.images.get(manager.image_name)
@@ -1,13 +1,14 @@
+import io
 import logging
 import subprocess
 from unittest.mock import MagicMock, PropertyMock, call, patch
 
 import pytest
 
-from service_manager.docker_manager import DockerManager
+from service_manager.docker_manager import DockerManager, _DockerAPIClient
 
-LOG_LINE_1 = "log line 1\n"
-LOG_LINE_2 = "log line 2\n"
+LOG_LINE_1 = b"log line 1\n"
+LOG_LINE_2 = b"log line 2\n"
 
 
 def test_docker_manager_init(caplog, config):
@@ -41,6 +42,18 @@ def test_docker_manager_init(caplog, config):
             f"Expected phrase not found in logs: {message}"
 
 
+def test_docker_manager_resolves_directories(config, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    docker = DockerManager(
+        config.service_name, "input", "output",
+        config.port, False, False
+    )
+
+    assert docker._input_directory == str(tmp_path.resolve() / "input")
+    assert docker._output_directory == str(tmp_path.resolve() / "output")
+
+
 @pytest.fixture(scope="function")
 def docker(config):
     docker = DockerManager(
@@ -48,6 +61,7 @@ def docker(config):
         config.output_directory, config.port,
         False, False
     )
+    docker._api_client = None
     return docker
 
 
@@ -57,15 +71,41 @@ def mock_subprocess_run():
         yield mock_run
 
 
-@pytest.mark.parametrize("mock_image, is_exists", (("some_image", True), ("", False)))
-def test_check_image_exists(mock_image, is_exists, docker, mock_run):
-    expected_command = ["docker", "images", "-q", docker._image_name]
+@pytest.mark.parametrize("code, is_exists", ((0, True), (1, False)))
+@patch.object(DockerManager, "_load_container_state")
+def test_check_image_exists(mock_load_state, code, is_exists, docker, mock_run):
+    expected_command = ["docker", "image", "inspect", "--format={{.Id}}", docker._image_name]
 
-    mock_run.return_value = MagicMock(stdout=mock_image)
+    mock_run.return_value = MagicMock(returncode=code)
     assert docker.docker_image_existence is is_exists
-    mock_run.assert_called_with(expected_command, capture_output=True, text=True, check=True)
+    mock_run.assert_called_with(expected_command, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, check=False)
+
 
+@pytest.mark.parametrize("code, is_exists", ((200, True), (404, False)))
+def test_check_image_exists_with_api(code, is_exists, docker, mock_run):
+    docker._api_client = MagicMock()
+    docker._api_client.request.return_value = (code, b"{}")
 
+    assert docker._check_image_exists() is is_exists
+
+    docker._api_client.request.assert_called_once_with(
+        "GET", f"/images/{docker._image_name}/json")
+    mock_run.assert_not_called()
+
+
+def test_check_image_exists_falls_back_to_cli(docker, mock_run):
+    docker._api_client = MagicMock()
+    docker._api_client.request.side_effect = _DockerAPIClient.APIUnavailableError()
+    mock_run.return_value = MagicMock(returncode=0)
+
+    assert docker._check_image_exists() is True
+
+    mock_run.assert_called_once()
+    assert docker._api_client is None
+
+
+@patch.object(DockerManager, "_load_container_state", MagicMock())
 @patch.object(DockerManager, "_check_image_exists")
 def test_build_image(mock_check_image_exists, docker, mock_run, caplog, config):
     mock_check_image_exists.return_value = False
@@ -76,6 +116,7 @@ def test_build_image(mock_check_image_exists, docker, mock_run, caplog, config):
     mock_run.assert_called_once_with(expected_command, check=True)
 
 
+@patch.object(DockerManager, "_load_container_state", MagicMock())
 @patch.object(DockerManager, "_check_image_exists")
 def test_build_image_when_image_exists_and_not_force_build(
         mock_check_image_exists, docker, mock_run, caplog, config):
@@ -88,6 +129,7 @@ def test_build_image_when_image_exists_and_not_force_build(
     assert "Image is already created. Using existing one." in caplog.text
 
 
+@patch.object(DockerManager, "_load_container_state", MagicMock())
 @patch.object(DockerManager, "_check_image_exists")
 def test_build_image_when_image_exists_and_force_build(
         mock_check_image_exists, docker, mock_run, caplog, config):
@@ -102,13 +144,16 @@ def test_build_image_when_image_exists_and_force_build(
     assert "Building Docker image..." in caplog.text
 
 
-@pytest.mark.parametrize("code, output, status", ((1, "", None), (0, "'running'", "running")))
+@pytest.mark.parametrize("code, output, status", (
+        (1, "", None), (0, "'running|extractor_service_image|false'", "running")))
 def test_container_status(code, output, status, docker, mock_run):
     command_output = MagicMock()
     command_output.returncode = code
     command_output.stdout = output
     mock_run.return_value = command_output
-    expected_command = ["docker", "inspect", "--format='{{.State.Status}}'", docker._container_name]
+    expected_command = ["docker", "inspect",
+                        "--format='{{.State.Status}}|{{.Config.Image}}|{{.Config.Tty}}'",
+                        docker._container_name]
 
     result_status = docker.container_status
 
@@ -116,6 +161,245 @@ def test_container_status(code, output, status, docker, mock_run):
     assert status == result_status
 
 
+def test_container_status_is_cached(docker, mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout="'exited|other_image'")
+
+    assert docker.container_status == "exited"
+    assert docker.container_status == "exited"
+
+    mock_run.assert_called_once()
+    docker._start_container()
+    assert docker.container_status == "running"
+    docker._stop_container()
+    assert docker.container_status == "exited"
+    assert mock_run.call_count == 3
+
+
+def test_docker_image_existence_is_cached(docker, mock_run, config):
+    mock_run.return_value = MagicMock(returncode=1)
+
+    assert docker.docker_image_existence is False
+    docker.build_image(config.dockerfile)
+    assert docker.docker_image_existence is True
+    assert docker.container_status is None
+
+    assert mock_run.call_count == 3
+
+
+@pytest.mark.parametrize("code, body, expected", (
+        (404, b'{"message": "No such container"}', (None, None, None)),
+        (200, b'{"State": {"Status": "running"}, "Config": {"Image": "image", "Tty": false}}',
+         ("running", "image", False))))
+def test_inspect_container_with_api(code, body, expected, docker, mock_run):
+    docker._api_client = MagicMock()
+    docker._api_client.request.return_value = (code, body)
+
+    result = docker._inspect_container()
+
+    docker._api_client.request.assert_called_once_with(
+        "GET", f"/containers/{docker._container_name}/json")
+    mock_run.assert_not_called()
+    assert result == expected
+
+
+def test_inspect_container_falls_back_to_cli(docker, mock_run):
+    api_client = MagicMock()
+    api_client.request.side_effect = _DockerAPIClient.APIUnavailableError()
+    docker._api_client = api_client
+    mock_run.return_value = MagicMock(returncode=0, stdout="'exited|image|true'")
+
+    result = docker._inspect_container()
+
+    api_client.request.assert_called_once()
+    mock_run.assert_called_once()
+    assert docker._api_client is None
+    assert result == ("exited", "image", True)
+
+
+@pytest.mark.parametrize("host, tls, is_client", (
+        ("tcp://localhost:2375", "", True),
+        ("tcp://localhost:2376", "1", False),
+        ("ssh://user@host", "", False),
+        ("npipe:////./pipe/docker_engine", "", False),
+        ("unix:///not/existing/docker.sock", "", False)))
+def test_docker_api_client_from_env(host, tls, is_client, monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", host)
+    monkeypatch.setenv("DOCKER_TLS_VERIFY", tls)
+
+    client = _DockerAPIClient.from_env()
+
+    assert (client is not None) is is_client
+
+
+@pytest.mark.parametrize("context_host, is_client", (
+        ("unix://{socket}", True),
+        ("tcp://remote:2376", False),
+        (None, False)))
+@patch.object(_DockerAPIClient, "_get_context_host")
+def test_docker_api_client_from_env_with_context(mock_context_host, context_host, is_client,
+                                                 monkeypatch, tmp_path):
+    socket_path = tmp_path / "docker.sock"
+    socket_path.touch()
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+    mock_context_host.return_value = context_host and context_host.format(socket=socket_path)
+
+    client = _DockerAPIClient.from_env()
+
+    mock_context_host.assert_called_once_with("remote")
+    assert (client is not None) is is_client
+
+
+@patch.object(_DockerAPIClient, "_get_context_host")
+def test_docker_api_client_from_env_host_overrides_context(mock_context_host, monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "tcp://localhost:2375")
+    monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+    monkeypatch.delenv("DOCKER_TLS_VERIFY", raising=False)
+
+    client = _DockerAPIClient.from_env()
+
+    mock_context_host.assert_not_called()
+    assert client is not None
+
+
+@pytest.mark.parametrize("config_content, expected", (
+        ('{"currentContext": "remote"}', "remote"),
+        ('{"auths": {}}', "default"),
+        ("not json", "default"),
+        (None, "default")))
+def test_get_current_context_from_config(config_content, expected, monkeypatch, tmp_path):
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+    monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+    if config_content is not None:
+        (tmp_path / "config.json").write_text(config_content)
+
+    assert _DockerAPIClient._get_current_context() == expected
+
+
+def test_get_current_context_from_env(monkeypatch):
+    monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+
+    assert _DockerAPIClient._get_current_context() == "remote"
+
+
+@pytest.mark.parametrize("code, output, expected", (
+        (0, "unix:///run/remote.sock\n", "unix:///run/remote.sock"),
+        (1, "", None)))
+def test_get_context_host(code, output, expected, mock_run):
+    mock_run.return_value = MagicMock(returncode=code, stdout=output)
+
+    result = _DockerAPIClient._get_context_host("remote")
+
+    mock_run.assert_called_once_with(
+        ["docker", "context", "inspect", "--format={{.Endpoints.docker.Host}}", "remote"],
+        capture_output=True, text=True, check=False)
+    assert result == expected
+
+
+def test_docker_api_client_request_error():
+    connection = MagicMock()
+    connection.request.side_effect = ConnectionRefusedError()
+    client = _DockerAPIClient(MagicMock(return_value=connection))
+
+    with pytest.raises(_DockerAPIClient.APIUnavailableError):
+        client.request("GET", "/_ping")
+
+    connection.close.assert_called_once()
+
+
+def test_docker_api_client_stream_uses_new_connection_without_timeout():
+    connection_factory = MagicMock()
+    client = _DockerAPIClient(connection_factory)
+
+    response = client.stream("GET", "/containers/name/logs?follow=1")
+
+    connection_factory.assert_called_with(timeout=None)
+    assert connection_factory.call_count == 2
+    assert response is connection_factory.return_value.getresponse.return_value
+
+
+def _logs_frame(payload: bytes) -> bytes:
+    return bytes([1, 0, 0, 0]) + len(payload).to_bytes(4, "big") + payload
+
+
+@pytest.mark.parametrize("content_type, tty", (
+        ("application/vnd.docker.multiplexed-stream", None),
+        ("application/vnd.docker.multiplexed-stream", False),
+        # daemons older than API 1.42 label multiplexed logs as raw stream
+        ("application/vnd.docker.raw-stream", False)))
+def test_read_api_logs_multiplexed(content_type, tty, docker):
+    stream = io.BytesIO(_logs_frame(LOG_LINE_1) + _logs_frame(LOG_LINE_2))
+    response = MagicMock()
+    response.getheader.return_value = content_type
+    response.read.side_effect = stream.read
+
+    result = list(docker._read_api_logs(response, tty))
+
+    assert result == [LOG_LINE_1, LOG_LINE_2]
+    response.close.assert_called_once()
+
+
+@pytest.mark.parametrize("content_type, tty", (
+        ("application/vnd.docker.raw-stream", None),
+        ("application/vnd.docker.raw-stream", True)))
+def test_read_api_logs_raw(content_type, tty, docker):
+    response = MagicMock()
+    response.getheader.return_value = content_type
+    response.read1.side_effect = [LOG_LINE_1, LOG_LINE_2, b""]
+
+    result = list(docker._read_api_logs(response, tty))
+
+    assert result == [LOG_LINE_1, LOG_LINE_2]
+    response.read.assert_not_called()
+    response.close.assert_called_once()
+
+
+def test_is_container_tty_is_cached(docker, mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout="'running|image|false'")
+
+    assert docker._is_container_tty() is False
+    assert docker._is_container_tty() is False
+
+    mock_run.assert_called_once()
+
+
+def test_run_container_is_not_tty(docker, mock_run, config):
+    docker._run_container(config.port, config.input_directory, config.output_directory)
+
+    assert docker._is_container_tty() is False
+    mock_run.assert_called_once()
+
+
+@patch("service_manager.docker_manager.sys.stdout")
+@patch.object(DockerManager, "_run_log_process")
+@patch.object(DockerManager, "_stop_container")
+def test_follow_container_logs_with_api(mock_stop, mock_run_log, mock_stdout, docker, caplog):
+    response = MagicMock(status=200)
+    response.getheader.return_value = "application/vnd.docker.raw-stream"
+    response.read1.side_effect = [LOG_LINE_1, b"Service ready for shutdown\n", LOG_LINE_2]
+    docker._api_client = MagicMock()
+    docker._api_client.stream.return_value = response
+    docker._tty_cache = True
+
+    with caplog.at_level(logging.INFO):
+        docker.follow_container_logs()
+
+    mock_run_log.assert_not_called()
+    response.close.assert_called_once()
+    mock_stop.assert_called_once()
+    mock_stdout.buffer.write.assert_has_calls([call(LOG_LINE_1)])
+    assert "Service has signaled readiness for shutdown." in caplog.text
+
+
+def test_docker_image_existence_from_container_inspect(docker, mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout=f"'exited|{docker._image_name}'")
+
+    assert docker.docker_image_existence is True
+    assert docker.container_status == "exited"
+
+    mock_run.assert_called_once()
+
+
 @pytest.mark.parametrize("build", (True, False))
 @pytest.mark.parametrize("status", ("exited", None, "running", "dead", "created"))
 @patch.object(DockerManager, "_stop_container")
@@ -210,8 +494,7 @@ def test_run_log_process(mock_popen, docker, caplog):
         result = docker._run_log_process()
 
     mock_popen.assert_called_once_with(
-        command, stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT, text=True, encoding="utf-8"
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
     )
     assert result
     assert f"Following logs for {docker._container_name}" in caplog.text
@@ -228,6 +511,44 @@ def test_stop_container_success(docker, mock_run, caplog):
     assert "Container stopped." in caplog.text
 
 
+@pytest.mark.parametrize("code, cli_called", ((204, False), (304, False), (404, True)))
+def test_stop_container_with_api(code, cli_called, docker, mock_run):
+    docker._api_client = MagicMock()
+    docker._api_client.request.return_value = (code, b"")
+
+    docker._stop_container()
+
+    docker._api_client.request.assert_called_once_with(
+        "POST", f"/containers/{docker._container_name}/stop?t={docker._stop_timeout}")
+    assert mock_run.called is cli_called
+    assert docker.container_status == "exited"
+
+
+@pytest.mark.parametrize("code, cli_called", ((204, False), (304, False), (500, True)))
+def test_start_container_with_api(code, cli_called, docker, mock_run):
+    docker._api_client = MagicMock()
+    docker._api_client.request.return_value = (code, b"")
+
+    docker._start_container()
+
+    docker._api_client.request.assert_called_once_with(
+        "POST", f"/containers/{docker._container_name}/start")
+    assert mock_run.called is cli_called
+    assert docker.container_status == "running"
+
+
+@pytest.mark.parametrize("code, cli_called", ((204, False), (409, True)))
+def test_delete_container_with_api(code, cli_called, docker, mock_run):
+    docker._api_client = MagicMock()
+    docker._api_client.request.return_value = (code, b"")
+
+    docker._delete_container()
+
+    docker._api_client.request.assert_called_once_with(
+        "DELETE", f"/containers/{docker._container_name}")
+    assert mock_run.called is cli_called
+
+
 def test_delete_container_success(docker, mock_run, caplog):
     expected_command = ["docker", "rm", docker._container_name]
 
@@ -239,12 +560,12 @@ def test_delete_container_success(docker, mock_run, caplog):
     assert "Container deleted." in caplog.text
 
 
-@patch("service_manager.docker_manager.sys.stdout.write")
+@patch("service_manager.docker_manager.sys.stdout")
 @patch.object(DockerManager, "_run_log_process")
 @patch.object(DockerManager, "_stop_container")
 def test_follow_container_logs_stopped_by_user(mock_stop, mock_run_log, mock_stdout, docker, caplog):
     mock_process = MagicMock()
-    mock_process.stdout.readline.side_effect = [LOG_LINE_1, LOG_LINE_2, KeyboardInterrupt()]
+    mock_process.stdout.read1.side_effect = [LOG_LINE_1, LOG_LINE_2, KeyboardInterrupt()]
     mock_run_log.return_value = mock_process
     mock_process.terminate = MagicMock()
     mock_process.wait = MagicMock()
@@ -259,18 +580,18 @@ def test_follow_container_logs_stopped_by_user(mock_stop, mock_run_log, mock_std
     mock_stop.assert_called_once()
 
     calls = [call(LOG_LINE_1), call(LOG_LINE_2)]
-    mock_stdout.assert_has_calls(calls, any_order=True)
+    mock_stdout.buffer.write.assert_has_calls(calls, any_order=True)
     assert "Process stopped by user." in caplog.text
     assert "Following container logs stopped." in caplog.text
 
 
-@patch("service_manager.docker_manager.sys.stdout.write")
+@patch("service_manager.docker_manager.sys.stdout")
 @patch.object(DockerManager, "_run_log_process")
 @patch.object(DockerManager, "_stop_container")
 def test_follow_container_logs_stopped_automatically(mock_stop, mock_run_log,
                                                      mock_stdout, docker, caplog):
     mock_process = MagicMock()
-    mock_process.stdout.readline.side_effect = [
+    mock_process.stdout.read1.side_effect = [
         LOG_LINE_1, LOG_LINE_2, DockerManager.ServiceShutdownSignal()
     ]
     mock_run_log.return_value = mock_process
@@ -287,6 +608,45 @@ def test_follow_container_logs_stopped_automatically(mock_stop, mock_run_log,
     mock_stop.assert_called_once()
 
     calls = [call(LOG_LINE_1), call(LOG_LINE_2)]
-    mock_stdout.assert_has_calls(calls, any_order=True)
+    mock_stdout.buffer.write.assert_has_calls(calls, any_order=True)
     assert "Service has signaled readiness for shutdown." in caplog.text
     assert "Following container logs stopped." in caplog.text
+
+
+@patch("service_manager.docker_manager.sys.stdout")
+@patch.object(DockerManager, "_run_log_process")
+@patch.object(DockerManager, "_stop_container")
+def test_follow_container_logs_shutdown_message_split_between_chunks(
+        mock_stop, mock_run_log, mock_stdout, docker, caplog):
+    mock_process = MagicMock()
+    mock_process.stdout.read1.side_effect = [
+        LOG_LINE_1, b"INFO - Service ready ", b"for shutdown\n", LOG_LINE_2, b""
+    ]
+    mock_run_log.return_value = mock_process
+
+    with caplog.at_level(logging.INFO):
+        docker.follow_container_logs()
+
+    mock_stop.assert_called_once()
+    assert call(LOG_LINE_2) not in mock_stdout.buffer.write.call_args_list
+    assert "Service has signaled readiness for shutdown." in caplog.text
+
+
+@patch("service_manager.docker_manager.sys.stdout")
+@patch.object(DockerManager, "_run_log_process")
+@patch.object(DockerManager, "_stop_container")
+def test_follow_container_logs_shutdown_message_one_byte_per_chunk(
+        mock_stop, mock_run_log, mock_stdout, docker, caplog):
+    message = b"INFO - Service ready for shutdown\n"
+    mock_process = MagicMock()
+    mock_process.stdout.read1.side_effect = [
+        LOG_LINE_1, *(message[i:i + 1] for i in range(len(message))), LOG_LINE_2, b""
+    ]
+    mock_run_log.return_value = mock_process
+
+    with caplog.at_level(logging.INFO):
+        docker.follow_container_logs()
+
+    mock_stop.assert_called_once()
+    assert call(LOG_LINE_2) not in mock_stdout.buffer.write.call_args_list
+    assert "Service has signaled readiness for shutdown." in caplog.text